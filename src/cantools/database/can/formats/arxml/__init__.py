@@ -1,18 +1,31 @@
 import re
 from typing import Any
-from xml.etree import ElementTree
+from xml.etree import ElementTree as StdElementTree
+
+try:
+    from lxml import etree as ElementTree
+except ImportError:
+    ElementTree = StdElementTree  # type: ignore[misc,unused-ignore]
 
 from ....utils import sort_signals_by_start_bit, type_sort_signals
 from ...internal_database import InternalDatabase
 from .bus_specifics import AutosarBusSpecifics
 from .database_specifics import AutosarDatabaseSpecifics
-from .ecu_extract_loader import EcuExtractLoader
+from .ecu_extract_loader import ECUC_VALUE_COLLECTION_XPATH, EcuExtractLoader
 from .end_to_end_properties import AutosarEnd2EndProperties
 from .message_specifics import AutosarMessageSpecifics
 from .node_specifics import AutosarNodeSpecifics
 from .secoc_properties import AutosarSecOCProperties
 from .system_loader import SystemLoader
 
+# regular expressions to recognize the XML namespace of ARXML files
+_ROOT_TAG_RE = re.compile(r'{(.*)}AUTOSAR')
+_RECOGNIZED_NAMESPACE_RES = (
+    re.compile(r'http://autosar.org/schema/r(4.*)'),
+    re.compile(r'http://autosar.org/(3.*)'),
+    re.compile(r'http://autosar.org/(.*)\.DAI\.[0-9]'),
+)
+
 
 def is_ecu_extract(root: Any # For whatever reason, mypy does not
                              # accept 'ElementTree' here...
@@ -24,18 +37,48 @@ def is_ecu_extract(root: Any # For whatever reason, mypy does not
     currently loading ECU extracts is only supported for AUTOSAR 4.
     """
 
-    ecuc_value_collection_xpath = \
-        './ns:AR-PACKAGES' + \
-        '/ns:AR-PACKAGE' + \
-        '/ns:ELEMENTS' + \
-        '/ns:ECUC-VALUE-COLLECTION'
+    ecuc_value_collection = root.find(ECUC_VALUE_COLLECTION_XPATH)
 
-    namespaces = { 'ns': 'http://autosar.org/schema/r4.0' }
+    return ecuc_value_collection is not None
 
-    ecuc_value_collection = \
-        root.find(ecuc_value_collection_xpath, namespaces)
+def _parse_string(string: str) -> Any:
+    """Parse an XML string into the root element of its element tree.
 
-    return ecuc_value_collection is not None
+    If `lxml` is available, it is used because it is much faster than
+    the standard library's parser.
+    """
+
+    # feed the string into a parser object instead of using
+    # fromstring(): lxml refuses unicode strings which feature an XML
+    # encoding declaration.
+    if ElementTree is StdElementTree:
+        parser = ElementTree.XMLParser()
+    else:
+        # the standard library's parser ignores comments and
+        # processing instructions. lxml keeps them in the tree by
+        # default, which only costs memory when loading a database.
+        # Likewise, the XML IDs are never looked up. Finally, external
+        # entities must neither be resolved nor fetched from the
+        # network because, like the standard library's parser, the
+        # loader ought to only see the contents of the string itself.
+        parser = ElementTree.XMLParser(remove_comments=True,
+                                       remove_pis=True,
+                                       collect_ids=False,
+                                       resolve_entities=False,
+                                       no_network=True)
+
+    try:
+        parser.feed(string)
+
+        return parser.close()
+    except ElementTree.ParseError:
+        if ElementTree is StdElementTree:
+            raise
+
+        # let the standard library have a go at the string. This
+        # makes the reported syntax errors independent of whether
+        # lxml is installed or not.
+        return StdElementTree.fromstring(string)
 
 def load_string(string:str,
                 strict:bool=True,
@@ -45,19 +88,16 @@ def load_string(string:str,
 
     """
 
-    root = ElementTree.fromstring(string)
+    root = _parse_string(string)
 
-    m = re.match(r'{(.*)}AUTOSAR', root.tag)
+    m = _ROOT_TAG_RE.match(root.tag)
     if not m:
         raise ValueError(f"No XML namespace specified or illegal root tag name '{root.tag}'")
     xml_namespace = m.group(1)
 
     # Should be replaced with a validation using the XSD file.
-    recognized_namespace = False
-    if re.match(r'http://autosar.org/schema/r(4.*)', xml_namespace) \
-       or re.match(r'http://autosar.org/(3.*)', xml_namespace) \
-       or re.match(r'http://autosar.org/(.*)\.DAI\.[0-9]', xml_namespace):
-        recognized_namespace = True
+    recognized_namespace = \
+        any(regex.match(xml_namespace) for regex in _RECOGNIZED_NAMESPACE_RES)
 
     if not recognized_namespace:
         raise ValueError(f"Unrecognized XML namespace '{xml_namespace}'")
@@ -1,6 +1,8 @@
 # Load an ECU extract CAN database from an ARXML formatted file.
 import logging
-from typing import TYPE_CHECKING, Any, List
+from collections import defaultdict
+from string import Template
+from typing import TYPE_CHECKING, Any, Dict, List
 
 from ....conversion import BaseConversion
 from ....utils import sort_signals_by_start_bit, type_sort_signals
@@ -12,17 +14,39 @@ if TYPE_CHECKING:
     from ...bus import Bus
 
 
+LOGGER = logging.getLogger(__name__)
+
+# The ARXML XML namespace for the EcuExtractLoader
+NAMESPACE = 'http://autosar.org/schema/r4.0'
+
+
 def make_xpath(location: List[str]) -> str:
     """Convenience function to traverse the XML element tree more easily
 
+    The tag names are fully qualified, so the resulting path can be
+    passed to find() and iterfind() without a namespace map.
+
     (This function is only used by the EcuExtractLoader.)"""
-    return './ns:' + '/ns:'.join(location)
+    return './' + '/'.join(f'{{{NAMESPACE}}}{tag}' for tag in location)
 
-LOGGER = logging.getLogger(__name__)
 
-# The ARXML XML namespace for the EcuExtractLoader
-NAMESPACE = 'http://autosar.org/schema/r4.0'
-NAMESPACES = {'ns': NAMESPACE}
+def find_child(elem: Any, tag: str) -> Any:
+    """Return the first direct child of the element with the given fully
+    qualified tag, or None.
+
+    Comparing the tags directly is faster than find(), in particular
+    with lxml."""
+    for child in elem:
+        if child.tag == tag:
+            return child
+
+    return None
+
+
+def short_name_predicate(short_name: str) -> str:
+    """Return an element path predicate matching a SHORT-NAME child"""
+    return f"[{{{NAMESPACE}}}SHORT-NAME='{short_name}']"
+
 
 ECUC_VALUE_COLLECTION_XPATH = make_xpath([
     'AR-PACKAGES',
@@ -39,14 +63,41 @@ ECUC_REFERENCE_VALUE_XPATH = make_xpath([
     'REFERENCE-VALUES',
     'ECUC-REFERENCE-VALUE'
 ])
-DEFINITION_REF_XPATH = make_xpath(['DEFINITION-REF'])
-VALUE_XPATH = make_xpath(['VALUE'])
-VALUE_REF_XPATH = make_xpath(['VALUE-REF'])
-SHORT_NAME_XPATH = make_xpath(['SHORT-NAME'])
-PARAMETER_VALUES_XPATH = make_xpath(['PARAMETER-VALUES'])
-REFERENCE_VALUES_XPATH = make_xpath([
-    'REFERENCE-VALUES'
-])
+
+# The values of ComSignalType of signed and floating point signals
+SIGNED_SIGNAL_TYPES = frozenset(['SINT8', 'SINT16', 'SINT32'])
+FLOAT_SIGNAL_TYPES = frozenset(['FLOAT32', 'FLOAT64'])
+
+# The fully qualified tags of direct children which are looked up
+# for each container or value. They are matched by find_child().
+SHORT_NAME_TAG = f'{{{NAMESPACE}}}SHORT-NAME'
+DEFINITION_REF_TAG = f'{{{NAMESPACE}}}DEFINITION-REF'
+VALUE_TAG = f'{{{NAMESPACE}}}VALUE'
+VALUE_REF_TAG = f'{{{NAMESPACE}}}VALUE-REF'
+PARAMETER_VALUES_TAG = f'{{{NAMESPACE}}}PARAMETER-VALUES'
+REFERENCE_VALUES_TAG = f'{{{NAMESPACE}}}REFERENCE-VALUES'
+
+# The paths used to look up containers of a package. They are only
+# built once; the name of the package is substituted for each lookup.
+COM_CONFIG_XPATH = Template(make_xpath([
+    'AR-PACKAGES',
+    'AR-PACKAGE' + short_name_predicate('$package'),
+    'ELEMENTS',
+    'ECUC-MODULE-CONFIGURATION-VALUES' + short_name_predicate('Com'),
+    'CONTAINERS',
+    'ECUC-CONTAINER-VALUE' + short_name_predicate('ComConfig'),
+    'SUB-CONTAINERS'
+]))
+CAN_IF_INIT_CFG_CONTAINERS_XPATH = Template(make_xpath([
+    'AR-PACKAGES',
+    'AR-PACKAGE' + short_name_predicate('$package'),
+    'ELEMENTS',
+    'ECUC-MODULE-CONFIGURATION-VALUES' + short_name_predicate('CanIf'),
+    'CONTAINERS',
+    'ECUC-CONTAINER-VALUE' + short_name_predicate('CanIfInitCfg'),
+    'SUB-CONTAINERS',
+    'ECUC-CONTAINER-VALUE'
+]))
 
 class EcuExtractLoader:
 
@@ -58,16 +109,20 @@ class EcuExtractLoader:
         self.strict = strict
         self.sort_signals = sort_signals
 
+        # The ComConfig containers indexed by their short name and the
+        # CanIf PDU configurations indexed by the referenced PDU, both
+        # per package. They are built on first use.
+        self._com_config_values: Dict[str, Dict[str, Any]] = {}
+        self._can_if_pdu_cfgs: Dict[str, Dict[str, Any]] = {}
+
     def load(self) -> InternalDatabase:
         buses:List[Bus] = []
         messages = []
         version = None
 
-        ecuc_value_collection = self.root.find(ECUC_VALUE_COLLECTION_XPATH,
-                                               NAMESPACES)
+        ecuc_value_collection = self.root.find(ECUC_VALUE_COLLECTION_XPATH)
         values_refs = ecuc_value_collection.iterfind(
-            ECUC_MODULE_CONFIGURATION_VALUES_REF_XPATH,
-            NAMESPACES)
+            ECUC_MODULE_CONFIGURATION_VALUES_REF_XPATH)
         com_xpaths = [
             value_ref.text
             for value_ref in values_refs
@@ -80,13 +135,17 @@ class EcuExtractLoader:
 
         com_config = self.find_com_config(com_xpaths[0] + '/ComConfig')
 
-        for ecuc_container_value in com_config:
-            definition_ref = ecuc_container_value.find(DEFINITION_REF_XPATH,
-                                                       NAMESPACES).text
+        # Bucket the containers by the last segment of their definition
+        # reference, so that only the ComIPdu ones need to be visited.
+        containers_by_definition: Dict[str, List[Any]] = defaultdict(list)
 
-            if not definition_ref.endswith('ComIPdu'):
-                continue
+        for ecuc_container_value in com_config:
+            definition_ref = find_child(ecuc_container_value,
+                                        DEFINITION_REF_TAG).text
+            definition = definition_ref.rsplit('/', 1)[-1]
+            containers_by_definition[definition].append(ecuc_container_value)
 
+        for ecuc_container_value in containers_by_definition.get('ComIPdu', ()):
             message = self.load_message(ecuc_container_value)
 
             if message is not None:
@@ -104,7 +163,7 @@ class EcuExtractLoader:
         comments = None
 
         # Name, frame id, length and is_extended_frame.
-        name = com_i_pdu.find(SHORT_NAME_XPATH, NAMESPACES).text
+        name = find_child(com_i_pdu, SHORT_NAME_TAG).text
         direction = None
 
         for parameter, value in self.iter_parameter_values(com_i_pdu):
@@ -151,16 +210,14 @@ class EcuExtractLoader:
 
         # Find all signals in this message.
         signals = []
-        values = com_i_pdu.iterfind(ECUC_REFERENCE_VALUE_XPATH,
-                                    NAMESPACES)
+        values = com_i_pdu.iterfind(ECUC_REFERENCE_VALUE_XPATH)
 
         for value in values:
-            definition_ref = value.find(DEFINITION_REF_XPATH,
-                                        NAMESPACES).text
+            definition_ref = find_child(value, DEFINITION_REF_TAG).text
             if not definition_ref.endswith('ComIPduSignalRef'):
                 continue
 
-            value_ref = value.find(VALUE_REF_XPATH, NAMESPACES)
+            value_ref = find_child(value, VALUE_REF_TAG)
             signal = self.load_signal(value_ref.text)
 
             if signal is not None:
@@ -202,13 +259,17 @@ class EcuExtractLoader:
         is_extended_frame = None
 
         if can_if_tx_pdu_cfg is not None:
-            for parameter, value in self.iter_parameter_values(can_if_tx_pdu_cfg):
-                if parameter == parameter_can_id:
-                    frame_id = int(value)
-                elif parameter == parameter_dlc:
-                    length = int(value)
-                elif parameter == parameter_can_id_type:
-                    is_extended_frame = (value == 'EXTENDED_CAN')
+            parameters = dict(self.iter_parameter_values(can_if_tx_pdu_cfg))
+
+            if parameter_can_id in parameters:
+                frame_id = int(parameters[parameter_can_id])
+
+            if parameter_dlc in parameters:
+                length = int(parameters[parameter_dlc])
+
+            if parameter_can_id_type in parameters:
+                is_extended_frame = \
+                    (parameters[parameter_can_id_type] == 'EXTENDED_CAN')
 
         return frame_id, length, is_extended_frame
 
@@ -217,11 +278,9 @@ class EcuExtractLoader:
         if ecuc_container_value is None:
             return None
 
-        name = ecuc_container_value.find(SHORT_NAME_XPATH, NAMESPACES).text
+        name = find_child(ecuc_container_value, SHORT_NAME_TAG).text
 
         # Default values.
-        is_signed = False
-        is_float = False
         minimum = None
         maximum = None
         factor = 1.0
@@ -232,22 +291,23 @@ class EcuExtractLoader:
         receivers = []
 
         # Bit position, length, byte order, is_signed and is_float.
+        parameters = dict(self.iter_parameter_values(ecuc_container_value))
         bit_position = None
         length = None
         byte_order = None
 
-        for parameter, value in self.iter_parameter_values(ecuc_container_value):
-            if parameter == 'ComBitPosition':
-                bit_position = int(value)
-            elif parameter == 'ComBitSize':
-                length = int(value)
-            elif parameter == 'ComSignalEndianness':
-                byte_order = value.lower()
-            elif parameter == 'ComSignalType':
-                if value in ['SINT8', 'SINT16', 'SINT32']:
-                    is_signed = True
-                elif value in ['FLOAT32', 'FLOAT64']:
-                    is_float = True
+        if 'ComBitPosition' in parameters:
+            bit_position = int(parameters['ComBitPosition'])
+
+        if 'ComBitSize' in parameters:
+            length = int(parameters['ComBitSize'])
+
+        if 'ComSignalEndianness' in parameters:
+            byte_order = parameters['ComSignalEndianness'].lower()
+
+        signal_type = parameters.get('ComSignalType')
+        is_signed = signal_type in SIGNED_SIGNAL_TYPES
+        is_float = signal_type in FLOAT_SIGNAL_TYPES
 
         if bit_position is None:
             LOGGER.warning('No bit position found for signal %s.',name)
@@ -288,87 +348,89 @@ class EcuExtractLoader:
                       )
 
     def find_com_config(self, xpath):
-        return self.root.find(make_xpath([
-            "AR-PACKAGES",
-            "AR-PACKAGE/[ns:SHORT-NAME='{}']".format(xpath.split('/')[1]),
-            "ELEMENTS",
-            "ECUC-MODULE-CONFIGURATION-VALUES/[ns:SHORT-NAME='Com']",
-            "CONTAINERS",
-            "ECUC-CONTAINER-VALUE/[ns:SHORT-NAME='ComConfig']",
-            "SUB-CONTAINERS"
-        ]),
-                              NAMESPACES)
+        return self.root.find(COM_CONFIG_XPATH.substitute(
+            package=xpath.split('/')[1]))
 
     def find_value(self, xpath):
-        return self.root.find(make_xpath([
-            "AR-PACKAGES",
-            "AR-PACKAGE/[ns:SHORT-NAME='{}']".format(xpath.split('/')[1]),
-            "ELEMENTS",
-            "ECUC-MODULE-CONFIGURATION-VALUES/[ns:SHORT-NAME='Com']",
-            "CONTAINERS",
-            "ECUC-CONTAINER-VALUE/[ns:SHORT-NAME='ComConfig']",
-            "SUB-CONTAINERS",
-            "ECUC-CONTAINER-VALUE/[ns:SHORT-NAME='{}']".format(xpath.split('/')[-1])
-        ]),
-                              NAMESPACES)
+        package = xpath.split('/')[1]
+        values = self._com_config_values.get(package)
+
+        if values is None:
+            values = {}
+            com_config = self.find_com_config(xpath)
+
+            if com_config is not None:
+                for ecuc_container_value in com_config:
+                    name = find_child(ecuc_container_value, SHORT_NAME_TAG)
+
+                    if name is not None:
+                        values.setdefault(name.text, ecuc_container_value)
+
+            self._com_config_values[package] = values
+
+        return values.get(xpath.split('/')[-1])
 
     def find_can_if_rx_tx_pdu_cfg(self, com_pdu_id_ref):
-        messages = self.root.iterfind(
-            make_xpath([
-                "AR-PACKAGES",
-                "AR-PACKAGE/[ns:SHORT-NAME='{}']".format(
-                    com_pdu_id_ref.split('/')[1]),
-                "ELEMENTS",
-                "ECUC-MODULE-CONFIGURATION-VALUES/[ns:SHORT-NAME='CanIf']",
-                'CONTAINERS',
-                "ECUC-CONTAINER-VALUE/[ns:SHORT-NAME='CanIfInitCfg']",
-                'SUB-CONTAINERS',
-                'ECUC-CONTAINER-VALUE'
-            ]),
-            NAMESPACES)
-
-        for message in messages:
-            definition_ref = message.find(DEFINITION_REF_XPATH,
-                                          NAMESPACES).text
-
-            if definition_ref.endswith('CanIfTxPduCfg'):
-                expected_reference = 'CanIfTxPduRef'
-            elif definition_ref.endswith('CanIfRxPduCfg'):
-                expected_reference = 'CanIfRxPduRef'
-            else:
-                continue
+        package = com_pdu_id_ref.split('/')[1]
+        pdu_cfgs = self._can_if_pdu_cfgs.get(package)
+
+        if pdu_cfgs is None:
+            pdu_cfgs = {}
+            messages = self.root.iterfind(
+                CAN_IF_INIT_CFG_CONTAINERS_XPATH.substitute(package=package))
+
+            for message in messages:
+                definition_ref = find_child(message, DEFINITION_REF_TAG).text
+
+                if definition_ref.endswith('CanIfTxPduCfg'):
+                    expected_reference = 'CanIfTxPduRef'
+                elif definition_ref.endswith('CanIfRxPduCfg'):
+                    expected_reference = 'CanIfRxPduRef'
+                else:
+                    continue
+
+                for reference, value in self.iter_reference_values(message):
+                    if reference == expected_reference:
+                        pdu_cfgs.setdefault(value, message)
+
+            self._can_if_pdu_cfgs[package] = pdu_cfgs
 
-            for reference, value in self.iter_reference_values(message):
-                if reference == expected_reference:
-                    if value == com_pdu_id_ref:
-                        return message
+        return pdu_cfgs.get(com_pdu_id_ref)
 
     def iter_parameter_values(self, param_conf_container):
-        parameters = param_conf_container.find(PARAMETER_VALUES_XPATH,
-                                               NAMESPACES)
+        parameters = find_child(param_conf_container, PARAMETER_VALUES_TAG)
 
         if parameters is None:
             raise ValueError('PARAMETER-VALUES does not exist.')
 
-        for parameter in parameters:
-            definition_ref = parameter.find(DEFINITION_REF_XPATH,
-                                            NAMESPACES).text
-            value = parameter.find(VALUE_XPATH, NAMESPACES).text
-            name = definition_ref.split('/')[-1]
-
-            yield name, value
+        return self._iter_values(parameters, VALUE_TAG)
 
     def iter_reference_values(self, param_conf_container):
-        references = param_conf_container.find(REFERENCE_VALUES_XPATH,
-                                               NAMESPACES)
+        references = find_child(param_conf_container, REFERENCE_VALUES_TAG)
 
         if references is None:
             raise ValueError('REFERENCE-VALUES does not exist.')
 
-        for reference in references:
-            definition_ref = reference.find(DEFINITION_REF_XPATH,
-                                            NAMESPACES).text
-            value = reference.find(VALUE_REF_XPATH, NAMESPACES).text
-            name = definition_ref.split('/')[-1]
+        return self._iter_values(references, VALUE_REF_TAG)
+
+    @staticmethod
+    def _iter_values(values, value_tag):
+        """Yield the last segment of the definition reference and the value
+        of each given parameter or reference value.
+
+        Both are direct children, so the children of each value are only
+        scanned once instead of looking them up individually.
+
+        """
+
+        for value_elem in values:
+            definition_ref = None
+            value = None
+
+            for child in value_elem:
+                if child.tag == DEFINITION_REF_TAG:
+                    definition_ref = child
+                elif child.tag == value_tag:
+                    value = child
 
-            yield name, value
+            yield definition_ref.text.rsplit('/', 1)[-1], value.text
@@ -1,9 +1,12 @@
 # Load a CAN database in ARXML format.
 import logging
 import re
+import sys
 from collections import OrderedDict
 from copy import deepcopy
-from typing import Any
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+from xml.etree.ElementTree import Element as StdElement
 
 from ....conversion import BaseConversion, IdentityConversion
 from ....namedsignalvalue import NamedSignalValue
@@ -21,8 +24,89 @@ from .node_specifics import AutosarNodeSpecifics
 from .secoc_properties import AutosarSecOCProperties
 from .utils import parse_number_string
 
+try:
+    from lxml.etree import _Element as LxmlElement
+except ImportError:
+    LxmlElement = StdElement
+
 LOGGER = logging.getLogger(__name__)
 
+# the classes of the XML elements which may be passed to the loader
+_ELEMENT_TYPES = (StdElement, LxmlElement)
+
+# regular expressions to determine the XML namespace and the AUTOSAR
+# version of a file
+_AUTOSAR_ROOT_TAG_RE = re.compile(r'^\{(.*)\}AUTOSAR$')
+_AR4_NAMESPACE_RE = re.compile(r'^http://autosar\.org/schema/r(4\.[0-9.]*)$')
+_AR3_NAMESPACE_RE = re.compile(r'^http://autosar\.org/(3\.[0-9.]*)$')
+_DAI_NAMESPACE_RE = re.compile(r'^http://autosar\.org/([0-9.]*)\.DAI\.[0-9]$')
+_AUTOSAR_VERSION_RE = re.compile(r'^([0-9]*)(\.[0-9]*)?(\.[0-9]*)?$')
+
+# the (is_signed, is_float) flags of the base type encodings. Types
+# which use two-complement, one-complement or sign+magnitude encodings
+# are signed. TODO (?): The fact that if anything other than two
+# complement notation is used for negative numbers is not reflected
+# anywhere. In practice this should not matter, though, since
+# two-complement notation is basically always used for systems build
+# after ~1970...
+_ENCODING_FLAGS = {
+    '2C': (True, False),
+    '1C': (True, False),
+    'SM': (True, False),
+    'IEEE754': (False, True),
+}
+
+@lru_cache(maxsize=1024)
+def _compile_arxml_location(xml_namespace, children_location):
+    """Translate an ARXML location into a tuple of traversal steps.
+
+    Each step is a tuple of the plain tag name, the fully qualified
+    tag names of the child and of a reference to it and the flag
+    indicating whether multiple nodes are allowed. Since the loader
+    uses the same few locations over and over again, the result is
+    cached.
+    """
+
+    # for convenience a location may also be a string. In this case
+    # we take it that a direct child node needs to be found.
+    if isinstance(children_location, str):
+        children_location = (children_location, )
+
+    steps = []
+    for child_tag_name in children_location:
+        # handle the set and reference specifiers of the current
+        # sub-location
+        allow_references = '&' in child_tag_name[:2]
+        is_nodeset = '*' in child_tag_name[:2]
+
+        if allow_references:
+            child_tag_name = child_tag_name[1:]
+
+        if is_nodeset:
+            child_tag_name = child_tag_name[1:]
+
+        steps.append((child_tag_name,
+                      f'{{{xml_namespace}}}{child_tag_name}',
+                      f'{{{xml_namespace}}}{child_tag_name}-REF',
+                      is_nodeset))
+
+    return tuple(steps)
+
+def _copy_choices(choices):
+    """Return a copy of the named values of a signal which does not
+    share any mutable objects with the original.
+
+    """
+    if choices is None:
+        return None
+
+    return {
+        value: NamedSignalValue(named_value.value,
+                                named_value.name,
+                                dict(named_value.comments))
+        for value, named_value in choices.items()
+    }
+
 class SystemLoader:
     def __init__(self,
                  root:Any,
@@ -32,7 +116,7 @@ class SystemLoader:
         self._strict = strict
         self._sort_signals = sort_signals
 
-        m = re.match(r'^\{(.*)\}AUTOSAR$', self._root.tag)
+        m = _AUTOSAR_ROOT_TAG_RE.match(self._root.tag)
 
         if not m:
             raise ValueError(f"No XML namespace specified or illegal root tag "
@@ -40,10 +124,49 @@ class SystemLoader:
 
         xml_namespace = m.group(1)
         self.xml_namespace = xml_namespace
-        self._xml_namespaces = { 'ns': xml_namespace }
 
-        m = re.match(r'^http://autosar\.org/schema/r(4\.[0-9.]*)$',
-                     xml_namespace)
+        # the fully qualified names of the XML tags which are looked up
+        # directly. Using these instead of namespaced path expressions
+        # spares us from parsing the path on every lookup.
+        ns_prefix = f'{{{xml_namespace}}}'
+        self._ns_prefix = ns_prefix
+        self._tag_ar_package = f'{ns_prefix}AR-PACKAGE'
+        self._tag_ar_packages = f'{ns_prefix}AR-PACKAGES'
+        self._tag_sub_packages = f'{ns_prefix}SUB-PACKAGES'
+        self._tag_top_level_packages = f'{ns_prefix}TOP-LEVEL-PACKAGES'
+        self._tag_short_name = f'{ns_prefix}SHORT-NAME'
+        self._tag_short_label = f'{ns_prefix}SHORT-LABEL'
+        self._tag_package_ref = f'{ns_prefix}PACKAGE-REF'
+        self._tag_is_default = f'{ns_prefix}IS-DEFAULT'
+        self._tag_is_global = f'{ns_prefix}IS-GLOBAL'
+        self._tag_init_value_ref = f'{ns_prefix}INIT-VALUE-REF'
+        self._tag_value = f'{ns_prefix}VALUE'
+        self._tag_length = f'{ns_prefix}LENGTH'
+        self._tag_start_position = f'{ns_prefix}START-POSITION'
+        self._tag_packing_byte_order = f'{ns_prefix}PACKING-BYTE-ORDER'
+        self._tag_lower_limit = f'{ns_prefix}LOWER-LIMIT'
+        self._tag_upper_limit = f'{ns_prefix}UPPER-LIMIT'
+        self._tag_compu_const = f'{ns_prefix}COMPU-CONST'
+        self._tag_compu_rational_coeffs = f'{ns_prefix}COMPU-RATIONAL-COEFFS'
+        self._compu_scale_ref_tags = (
+            f'{ns_prefix}COMPU-CONST-REF',
+            f'{ns_prefix}COMPU-RATIONAL-COEFFS-REF',
+        )
+        self._tag_l_2 = f'{ns_prefix}L-2'
+        self._tag_reference_base = f'{ns_prefix}REFERENCE-BASE'
+        self._tag_system_signal = f'{ns_prefix}SYSTEM-SIGNAL'
+        self._tag_nm_pdu = f'{ns_prefix}NM-PDU'
+        self._tag_secured_i_pdu = f'{ns_prefix}SECURED-I-PDU'
+        self._tag_container_i_pdu = f'{ns_prefix}CONTAINER-I-PDU'
+        self._tag_multiplexed_i_pdu = f'{ns_prefix}MULTIPLEXED-I-PDU'
+        self._general_purpose_pdu_tags = (
+            f'{ns_prefix}N-PDU',
+            f'{ns_prefix}GENERAL-PURPOSE-PDU',
+            f'{ns_prefix}GENERAL-PURPOSE-I-PDU',
+            f'{ns_prefix}USER-DEFINED-I-PDU',
+        )
+
+        m = _AR4_NAMESPACE_RE.match(xml_namespace)
 
         if m:
             # AUTOSAR 4: For some reason, all AR 4 revisions always
@@ -59,15 +182,14 @@ class SystemLoader:
             autosar_version_string = m.group(1)
 
         else:
-            m = re.match(r'^http://autosar\.org/(3\.[0-9.]*)$', xml_namespace)
+            m = _AR3_NAMESPACE_RE.match(xml_namespace)
 
             if m:
                 # AUTOSAR 3
                 autosar_version_string = m.group(1)
 
             else:
-                m = re.match(r'^http://autosar\.org/([0-9.]*)\.DAI\.[0-9]$',
-                             xml_namespace)
+                m = _DAI_NAMESPACE_RE.match(xml_namespace)
 
                 if m:
                     # Daimler (for some model ranges)
@@ -77,8 +199,7 @@ class SystemLoader:
                     raise ValueError(f"Unrecognized AUTOSAR XML namespace "
                                      f"'{xml_namespace}'")
 
-        m = re.match(r'^([0-9]*)(\.[0-9]*)?(\.[0-9]*)?$',
-                     autosar_version_string)
+        m = _AUTOSAR_VERSION_RE.match(autosar_version_string)
 
         if not m:
             raise ValueError(f"Could not parse AUTOSAR version "
@@ -95,6 +216,143 @@ class SystemLoader:
             raise ValueError('This class only supports AUTOSAR '
                              'versions 3 and 4')
 
+        # whether the file uses AUTOSAR 4. This is queried all over
+        # the place, so it is determined only once.
+        self._is_ar4 = self.autosar_version_newer(4)
+
+        # ARXML locations which differ between AUTOSAR 3 and 4. These
+        # are used for each ECU, frame, PDU or signal, so we only want
+        # to build them once.
+        if self._is_ar4:
+            self._pdu_groups_spec: Tuple[str, ...] = (
+                'ASSOCIATED-COM-I-PDU-GROUP-REFS',
+                '*&ASSOCIATED-COM-I-PDU-GROUP',
+            )
+            self._pdu_group_pdus_spec: Tuple[str, ...] = (
+                'I-SIGNAL-I-PDUS',
+                '*I-SIGNAL-I-PDU-REF-CONDITIONAL',
+                '&I-SIGNAL-I-PDU',
+            )
+            self._frame_triggerings_spec: Tuple[str, ...] = (
+                'CAN-CLUSTER-VARIANTS',
+                '*&CAN-CLUSTER-CONDITIONAL',
+                'PHYSICAL-CHANNELS',
+                '*&CAN-PHYSICAL-CHANNEL',
+                'FRAME-TRIGGERINGS',
+                '*&CAN-FRAME-TRIGGERING',
+            )
+            self._time_period_location: Tuple[str, ...] = (
+                'I-PDU-TIMING-SPECIFICATIONS',
+                'I-PDU-TIMING',
+                'TRANSMISSION-MODE-DECLARATION',
+                'TRANSMISSION-MODE-TRUE-TIMING',
+                'CYCLIC-TIMING',
+                'TIME-PERIOD',
+                'VALUE',
+            )
+            self._dynpart_spec: Tuple[str, ...] = (
+                'DYNAMIC-PARTS',
+                '*DYNAMIC-PART',
+                'DYNAMIC-PART-ALTERNATIVES',
+                '*DYNAMIC-PART-ALTERNATIVE',
+            )
+            self._static_pdu_refs_spec: Tuple[str, ...] = (
+                'STATIC-PARTS',
+                '*STATIC-PART',
+                'I-PDU-REF',
+            )
+            # in AR4, "normal" PDUs use I-SIGNAL-TO-PDU-MAPPINGS whilst
+            # network management PDUs use I-SIGNAL-TO-I-PDU-MAPPINGS
+            self._signal_to_pdu_mappings_tags: Tuple[str, ...] = (
+                f'{ns_prefix}I-SIGNAL-TO-PDU-MAPPINGS',
+                f'{ns_prefix}I-SIGNAL-TO-I-PDU-MAPPINGS',
+            )
+            self._compu_method_spec: Tuple[str, ...] = (
+                '&PHYSICAL-PROPS',
+                'SW-DATA-DEF-PROPS-VARIANTS',
+                '&SW-DATA-DEF-PROPS-CONDITIONAL',
+                '&COMPU-METHOD',
+            )
+            self._i_signal_spec = '&I-SIGNAL'
+
+            # the loaders which are implemented differently for
+            # AUTOSAR 3 and 4 are selected once instead of checking
+            # the version for every signal
+            self._load_arxml_init_value_string = \
+                self._load_arxml_init_value_string_ar4
+            self._load_arxml_invalid_int_value = \
+                self._load_arxml_invalid_int_value_ar4
+        else: # AUTOSAR 3
+            self._pdu_groups_spec = (
+                'ASSOCIATED-I-PDU-GROUP-REFS',
+                '*&ASSOCIATED-I-PDU-GROUP',
+            )
+            self._pdu_group_pdus_spec = (
+                'I-PDU-REFS',
+                '*&I-PDU',
+            )
+            self._frame_triggerings_spec = (
+                'PHYSICAL-CHANNELS',
+                '*&PHYSICAL-CHANNEL',
+
+                # ATTENTION! The trailig 'S' here is in purpose:
+                # It appears in the AUTOSAR 3.2 XSD, but it still
+                # seems to be a typo in the spec...
+                'FRAME-TRIGGERINGSS',
+
+                '*&CAN-FRAME-TRIGGERING',
+            )
+            self._time_period_location = (
+                'I-PDU-TIMING-SPECIFICATION',
+                'CYCLIC-TIMING',
+                'REPEATING-TIME',
+                'VALUE',
+            )
+            self._dynpart_spec = (
+                'DYNAMIC-PART',
+                'DYNAMIC-PART-ALTERNATIVES',
+                '*DYNAMIC-PART-ALTERNATIVE',
+            )
+            self._static_pdu_refs_spec = (
+                'STATIC-PART',
+                'I-PDU-REF',
+            )
+            # in AR3, "normal" PDUs use SIGNAL-TO-PDU-MAPPINGS whilst
+            # network management PDUs use I-SIGNAL-TO-I-PDU-MAPPINGS
+            self._signal_to_pdu_mappings_tags = (
+                f'{ns_prefix}SIGNAL-TO-PDU-MAPPINGS',
+                f'{ns_prefix}I-SIGNAL-TO-I-PDU-MAPPINGS',
+            )
+            self._compu_method_spec = (
+                '&DATA-TYPE',
+                'SW-DATA-DEF-PROPS',
+                '&COMPU-METHOD',
+            )
+            self._i_signal_spec = '&SIGNAL'
+
+            self._load_arxml_init_value_string = \
+                self._load_arxml_init_value_string_ar3
+            self._load_arxml_invalid_int_value = \
+                self._load_arxml_invalid_int_value_ar3
+
+        # the loaders of the supported compu method categories. each
+        # of them returns the minimum, maximum, factor, offset and
+        # choices of a signal. (they share a common signature, which
+        # is why _load_texttable() accepts an unused is_float argument.)
+        self._compu_method_loaders = {
+            'TEXTTABLE': self._load_texttable,
+            'LINEAR': self._load_linear,
+            'SCALE_LINEAR_AND_TEXTTABLE': self._load_scale_linear_and_texttable,
+        }
+
+        # many signals share the same system signal, so the properties
+        # loaded from it are cached. (see _load_signal())
+        self._system_signal_cache: Dict[Any, Tuple[Any, ...]] = {}
+
+        # likewise, many system signals share the same compu method,
+        # e.g., most boolean signals. (see _load_system_signal())
+        self._compu_method_cache: Dict[Any, Tuple[Any, ...]] = {}
+
         self._create_arxml_reference_dicts()
 
     def autosar_version_newer(self, major, minor=None, patch=None):
@@ -138,28 +396,30 @@ class SystemLoader:
     def load(self) -> InternalDatabase:
         messages = []
 
-        if self.autosar_version_newer(4):
-            root_packages = self._root.find("./ns:AR-PACKAGES",
-                                            self._xml_namespaces)
+        if self._is_ar4:
+            root_packages = self._root.find(self._tag_ar_packages)
         else:
             # AUTOSAR3 puts the top level packages beneath the
             # TOP-LEVEL-PACKAGES XML tag.
-            root_packages = self._root.find("./ns:TOP-LEVEL-PACKAGES",
-                                            self._xml_namespaces)
+            root_packages = self._root.find(self._tag_top_level_packages)
 
-        buses = self._load_buses(root_packages)
-        nodes = self._load_nodes(root_packages)
-        messages = self._load_messages(root_packages)
+        # walk the package hierarchy only once. all of the loading
+        # passes below operate on the resulting flat list of packages
+        packages = list(self._iter_packages(root_packages))
+
+        buses = self._load_buses(packages)
+        nodes = self._load_nodes(packages)
+        messages = self._load_messages(packages)
 
         # the senders and receivers can only be loaded once all
         # messages are known...
-        self._load_senders_and_receivers(root_packages, messages)
+        self._load_senders_and_receivers(packages, messages)
 
         # although there must only be one system globally, it can be
         # located within any package and the parameters which it
         # specifies affect a bunch of messages at once. we thus have
         # to load it separately...
-        self._load_system(root_packages, messages)
+        self._load_system(packages, messages)
 
         arxml_version = \
             f'{self.autosar_version_major}.' \
@@ -170,7 +430,7 @@ class SystemLoader:
             AutosarDatabaseSpecifics(arxml_version=arxml_version)
 
         # the data IDs (for end-to-end protection)
-        self._load_e2e_properties(root_packages, messages)
+        self._load_e2e_properties(packages, messages)
 
         return InternalDatabase(buses=buses,
                                 nodes=nodes,
@@ -178,39 +438,75 @@ class SystemLoader:
                                 version=None,
                                 autosar_specifics=autosar_specifics)
 
-    def _load_buses(self, package_list):
-        """Recursively extract all buses of all CAN clusters of a list of
-        AUTOSAR packages.
+    def _iter_packages(self, package_list):
+        """Iterate over all AUTOSAR packages contained by a list of
+        packages and their sub-packages.
+
+        The packages are yielded in document order, i.e., each package
+        is immediately followed by its sub-packages.
+        """
+
+        if package_list is None:
+            return
+
+        if self._is_ar4:
+            sub_packages_tag = self._tag_ar_packages
+        else:
+            sub_packages_tag = self._tag_sub_packages
+
+        # instead of recursing into the sub-packages, we keep a stack
+        # of the package lists which are currently being processed
+        work_list = [ package_list.iterfind(self._tag_ar_package) ]
+
+        while work_list:
+            package = next(work_list[-1], None)
+
+            if package is None:
+                # all packages of the innermost list have been visited
+                work_list.pop()
+                continue
+
+            yield package
+
+            sub_package_list = package.find(sub_packages_tag)
+
+            if sub_package_list is not None:
+                work_list.append(
+                    sub_package_list.iterfind(self._tag_ar_package))
+
+    def _load_buses(self, packages):
+        """Extract all buses of all CAN clusters of a list of AUTOSAR
+        packages.
 
         @return The list of all buses contained in the given list of
-                packages and their sub-packages
+                packages
         """
 
         buses = []
 
-        for package in package_list:
+        for package in packages:
             can_clusters = \
                 self._get_arxml_children(package,
-                                         [
+                                         (
                                              'ELEMENTS',
                                              '*&CAN-CLUSTER',
-                                         ])
+                                         ))
 
             # handle locally-specified clusters
             for can_cluster in can_clusters:
                 autosar_specifics = AutosarBusSpecifics()
 
-                if self.autosar_version_newer(4):
+                if self._is_ar4:
                     name = \
                         self._get_unique_arxml_child(can_cluster,
                                                      'SHORT-NAME').text
                     comments = self._load_comments(can_cluster)
                     variants = \
                         self._get_arxml_children(can_cluster,
-                                                 [
+                                                 (
                                                      'CAN-CLUSTER-VARIANTS',
                                                      '*CAN-CLUSTER-CONDITIONAL',
-                                                 ])
+                                                 ))
 
                     if variants is None or len(variants) == 0:
                         # WTH?
@@ -273,44 +569,20 @@ class SystemLoader:
                                      baudrate=baudrate,
                                      fd_baudrate=fd_baudrate))
 
-            # handle all sub-packages
-            if self.autosar_version_newer(4):
-                sub_package_list = package.find('./ns:AR-PACKAGES',
-                                                self._xml_namespaces)
-            else:
-                sub_package_list = package.find('./ns:SUB-PACKAGES',
-                                                self._xml_namespaces)
-
-            if sub_package_list is not None:
-                buses.extend(self._load_buses(sub_package_list))
-
         return buses
 
     # deal with the senders of messages and the receivers of signals
-    def _load_senders_and_receivers(self, package_list, messages):
-        if package_list is None:
-            return
-
-        for package in self._get_arxml_children(package_list, '*AR-PACKAGE'):
+    def _load_senders_and_receivers(self, packages, messages):
+        for package in packages:
             for ecu_instance in self._get_arxml_children(package,
-                                                         [
+                                                         (
                                                              'ELEMENTS',
                                                              '*ECU-INSTANCE'
-                                                         ]):
+                                                         )):
                 self._load_senders_receivers_of_ecu(ecu_instance, messages)
 
             self._load_senders_receivers_of_nm_pdus(package, messages)
 
-            # handle sub-packages
-            if self.autosar_version_newer(4):
-                sub_package_list = self._get_unique_arxml_child(package,
-                                                                'AR-PACKAGES')
-            else: # AUTOSAR 3
-                sub_package_list = self._get_unique_arxml_child(package,
-                                                                'SUB-PACKAGES')
-
-            self._load_senders_and_receivers(sub_package_list, messages)
-
     # given a list of Message objects and an reference to a PDU by its absolute ARXML path,
     # return the subset of messages of the list which feature the specified PDU.
     def __get_messages_of_pdu(self, msg_list, pdu_path):
@@ -346,37 +618,15 @@ class SystemLoader:
         ####
         # load senders and receivers of "normal" messages
         ####
-        if self.autosar_version_newer(4):
-            pdu_groups_spec = [
-                'ASSOCIATED-COM-I-PDU-GROUP-REFS',
-                '*&ASSOCIATED-COM-I-PDU-GROUP'
-            ]
-        else: # AUTOSAR 3
-            pdu_groups_spec = [
-                'ASSOCIATED-I-PDU-GROUP-REFS',
-                '*&ASSOCIATED-I-PDU-GROUP'
-            ]
-
         for pdu_group in self._get_arxml_children(ecu_instance,
-                                                  pdu_groups_spec):
+                                                  self._pdu_groups_spec):
             comm_dir = \
                 self._get_unique_arxml_child(pdu_group,
                                              'COMMUNICATION-DIRECTION')
             comm_dir = comm_dir.text
 
-            if self.autosar_version_newer(4):
-                pdu_spec = [
-                    'I-SIGNAL-I-PDUS',
-                    '*I-SIGNAL-I-PDU-REF-CONDITIONAL',
-                    '&I-SIGNAL-I-PDU'
-                ]
-            else: # AUTOSAR 3
-                pdu_spec = [
-                    'I-PDU-REFS',
-                    '*&I-PDU'
-                ]
-
-            for pdu in self._get_arxml_children(pdu_group, pdu_spec):
+            for pdu in self._get_arxml_children(pdu_group,
+                                                self._pdu_group_pdus_spec):
                 pdu_path = self._node_to_arxml_path.get(pdu)
                 pdu_messages = \
                     self.__get_messages_of_pdu(messages, pdu_path)
@@ -396,23 +646,23 @@ class SystemLoader:
         # senders and receivers of network management messages
         ####
 
-        if not self.autosar_version_newer(4):
+        if not self._is_ar4:
             # only AUTOSAR4 seems to support specifying senders and
             # receivers of network management PDUs...
             return
 
         for nm_cluster in self._get_arxml_children(package,
-                                                   [
+                                                   (
                                                        'ELEMENTS',
                                                        '*NM-CONFIG',
                                                        'NM-CLUSTERS',
                                                        '*CAN-NM-CLUSTER',
-                                                   ]):
+                                                   )):
 
-            nm_node_spec = [
+            nm_node_spec = (
                 'NM-NODES',
                 '*CAN-NM-NODE'
-            ]
+            )
             for nm_node in self._get_arxml_children(nm_cluster, nm_node_spec):
                 controller_ref = self._get_unique_arxml_child(nm_node,
                                                               'CONTROLLER-REF')
@@ -440,10 +690,10 @@ class SystemLoader:
 
                 # deal with receive PDUs
                 for rx_pdu in self._get_arxml_children(nm_node,
-                                                       [
+                                                       (
                                                            'RX-NM-PDU-REFS',
                                                            '*&RX-NM-PDU'
-                                                       ]):
+                                                       )):
                     pdu_path = self._node_to_arxml_path.get(rx_pdu)
                     pdu_messages = self.__get_messages_of_pdu(messages,
                                                               pdu_path)
@@ -455,10 +705,10 @@ class SystemLoader:
 
                 # deal with transmit PDUs
                 for tx_pdu in self._get_arxml_children(nm_node,
-                                                       [
+                                                       (
                                                            'TX-NM-PDU-REFS',
                                                            '*&TX-NM-PDU'
-                                                       ]):
+                                                       )):
                     pdu_path = self._node_to_arxml_path.get(tx_pdu)
                     pdu_messages = self.__get_messages_of_pdu(messages,
                                                               pdu_path)
@@ -467,7 +717,7 @@ class SystemLoader:
                         if ecu_name not in pdu_message.senders:
                             pdu_message.senders.append(ecu_name)
 
-    def _load_system(self, package_list, messages):
+    def _load_system(self, packages, messages):
         """Internalize the information specified by the system.
 
         Note that, even though there might at most be a single system
@@ -476,26 +726,14 @@ class SystemLoader:
         for this.
         """
 
-        for package in package_list:
+        for package in packages:
             system = self._get_unique_arxml_child(package,
-                                                  [
+                                                  (
                                                       'ELEMENTS',
                                                       'SYSTEM'
-                                                  ])
+                                                  ))
 
             if system is None:
-                # handle sub-packages
-                if self.autosar_version_newer(4):
-                    sub_package_list = package.find('./ns:AR-PACKAGES',
-                                                    self._xml_namespaces)
-
-                else:
-                    sub_package_list = package.find('./ns:SUB-PACKAGES',
-                                                    self._xml_namespaces)
-
-                if sub_package_list is not None:
-                    self._load_system(sub_package_list, messages)
-
                 continue
 
             # set the byte order of all container messages
@@ -516,22 +754,22 @@ class SystemLoader:
                 if message.is_container:
                     message.header_byte_order = container_header_byte_order
 
-    def _load_nodes(self, package_list):
-        """Recursively extract all nodes (ECU-instances in AUTOSAR-speak) of
-        all CAN clusters of a list of AUTOSAR packages.
+    def _load_nodes(self, packages):
+        """Extract all nodes (ECU-instances in AUTOSAR-speak) of all CAN
+        clusters of a list of AUTOSAR packages.
 
         @return The list of all nodes contained in the given list of
-                packages and their sub-packages
+                packages
         """
 
         nodes = []
 
-        for package in package_list:
+        for package in packages:
             for ecu in self._get_arxml_children(package,
-                                                [
+                                                (
                                                     'ELEMENTS',
                                                     '*ECU-INSTANCE',
-                                                ]):
+                                                )):
                 name = self._get_unique_arxml_child(ecu, "SHORT-NAME").text
                 comments = self._load_comments(ecu)
                 autosar_specifics = AutosarNodeSpecifics()
@@ -540,38 +778,25 @@ class SystemLoader:
                                   comment=comments,
                                   autosar_specifics=autosar_specifics))
 
-            # handle all sub-packages
-            if self.autosar_version_newer(4):
-                sub_package_list = package.find('./ns:AR-PACKAGES',
-                                                self._xml_namespaces)
-
-            else:
-                sub_package_list = package.find('./ns:SUB-PACKAGES',
-                                                self._xml_namespaces)
-
-            if sub_package_list is not None:
-                nodes.extend(self._load_nodes(sub_package_list))
-
-
         return nodes
 
-    def _load_e2e_properties(self, package_list, messages):
+    def _load_e2e_properties(self, packages, messages):
         """Internalize AUTOSAR end-to-end protection properties required for
         implementing end-to-end protection (CRCs) of messages.
 
         """
 
-        for package in package_list:
+        for package in packages:
 
             # specify DIDs via AUTOSAR E2Eprotection sets
             e2e_protections = \
                 self._get_arxml_children(package,
-                                         [
+                                         (
                                              'ELEMENTS',
                                              '*END-TO-END-PROTECTION-SET',
                                              'END-TO-END-PROTECTIONS',
                                              '*END-TO-END-PROTECTION',
-                                         ])
+                                         ))
 
             for e2e_protection in e2e_protections:
                 profile = self._get_unique_arxml_child(e2e_protection,
@@ -588,21 +813,21 @@ class SystemLoader:
 
                 data_id_elems = \
                     self._get_arxml_children(profile,
-                                             [
+                                             (
                                                  'DATA-IDS',
                                                  '*DATA-ID'
-                                             ])
+                                             ))
                 data_ids = []
                 for data_id_elem in data_id_elems:
                     data_ids.append(parse_number_string(data_id_elem.text))
                 e2e_props.data_ids = data_ids
 
                 pdus = self._get_arxml_children(e2e_protection,
-                                [
+                                (
                                     'END-TO-END-PROTECTION-I-SIGNAL-I-PDUS',
                                     '*END-TO-END-PROTECTION-I-SIGNAL-I-PDU',
                                     '&I-SIGNAL-I-PDU',
-                                ])
+                                ))
                 for pdu in pdus:
                     pdu_path = self._node_to_arxml_path.get(pdu)
                     pdu_messages = \
@@ -623,46 +848,21 @@ class SystemLoader:
 
                         message.autosar.e2e = pdu_e2e
 
-            # load all sub-packages
-            if self.autosar_version_newer(4):
-                sub_package_list = package.find('./ns:AR-PACKAGES',
-                                            self._xml_namespaces)
-
-            else:
-                sub_package_list = package.find('./ns:SUB-PACKAGES',
-                                                self._xml_namespaces)
-
-            if sub_package_list is not None:
-                self._load_e2e_properties(sub_package_list, messages)
-
-    def _load_messages(self, package_list):
-        """Recursively extract all messages of all CAN clusters of a list of
-        AUTOSAR packages.
+    def _load_messages(self, packages):
+        """Extract all messages of all CAN clusters of a list of AUTOSAR
+        packages.
 
         @return The list of all messages contained in the given list of
-                packages and their sub-packages
+                packages
         """
 
         messages = []
 
         # load all messages of all packages in an list of XML package elements
-        for package in package_list.iterfind('./ns:AR-PACKAGE',
-                                             self._xml_namespaces):
+        for package in packages:
             # deal with the messages of the current package
             messages.extend(self._load_package_messages(package))
 
-            # load all sub-packages
-            if self.autosar_version_newer(4):
-                sub_package_list = package.find('./ns:AR-PACKAGES',
-                                            self._xml_namespaces)
-
-            else:
-                sub_package_list = package.find('./ns:SUB-PACKAGES',
-                                                self._xml_namespaces)
-
-            if sub_package_list is not None:
-                messages.extend(self._load_messages(sub_package_list))
-
         return messages
 
     def _load_package_messages(self, package_elem):
@@ -673,41 +873,16 @@ class SystemLoader:
         messages = []
 
         can_clusters = self._get_arxml_children(package_elem,
-                                                [
+                                                (
                                                     'ELEMENTS',
                                                     '*&CAN-CLUSTER',
-                                                ])
+                                                ))
         for can_cluster in can_clusters:
             bus_name = self._get_unique_arxml_child(can_cluster,
                                                     'SHORT-NAME').text
-            if self.autosar_version_newer(4):
-                frame_triggerings_spec = \
-                    [
-                        'CAN-CLUSTER-VARIANTS',
-                        '*&CAN-CLUSTER-CONDITIONAL',
-                        'PHYSICAL-CHANNELS',
-                        '*&CAN-PHYSICAL-CHANNEL',
-                        'FRAME-TRIGGERINGS',
-                        '*&CAN-FRAME-TRIGGERING'
-                    ]
-
-            # AUTOSAR 3
-            else:
-                frame_triggerings_spec = \
-                    [
-                        'PHYSICAL-CHANNELS',
-                        '*&PHYSICAL-CHANNEL',
-
-                        # ATTENTION! The trailig 'S' here is in purpose:
-                        # It appears in the AUTOSAR 3.2 XSD, but it still
-                        # seems to be a typo in the spec...
-                        'FRAME-TRIGGERINGSS',
-
-                        '*&CAN-FRAME-TRIGGERING'
-                    ]
-
             can_frame_triggerings = \
-                self._get_arxml_children(can_cluster, frame_triggerings_spec)
+                self._get_arxml_children(can_cluster,
+                                         self._frame_triggerings_spec)
 
             for can_frame_triggering in can_frame_triggerings:
                 messages.append(self._load_message(bus_name,
@@ -783,15 +958,10 @@ class SystemLoader:
             contained_messages = \
                 self._load_pdu(pdu, name, 1)
         autosar_specifics._pdu_paths.extend(child_pdu_paths)
-        autosar_specifics._is_nm = \
-            (pdu.tag == f'{{{self.xml_namespace}}}NM-PDU')
+        autosar_specifics._is_nm = (pdu.tag == self._tag_nm_pdu)
         autosar_specifics._is_general_purpose = \
-            (pdu.tag == f'{{{self.xml_namespace}}}N-PDU') or \
-            (pdu.tag == f'{{{self.xml_namespace}}}GENERAL-PURPOSE-PDU') or \
-            (pdu.tag == f'{{{self.xml_namespace}}}GENERAL-PURPOSE-I-PDU') or \
-            (pdu.tag == f'{{{self.xml_namespace}}}USER-DEFINED-I-PDU')
-        is_secured = \
-            (pdu.tag == f'{{{self.xml_namespace}}}SECURED-I-PDU')
+            (pdu.tag in self._general_purpose_pdu_tags)
+        is_secured = (pdu.tag == self._tag_secured_i_pdu)
 
         self._load_e2e_data_id_from_signal_group(pdu, autosar_specifics)
         if is_secured:
@@ -828,7 +998,7 @@ class SystemLoader:
                                  signals,
                                  autosar_specifics):
         payload_pdu = \
-            self._get_unique_arxml_child(pdu, [ '&PAYLOAD', '&I-PDU' ])
+            self._get_unique_arxml_child(pdu, ( '&PAYLOAD', '&I-PDU' ))
 
         payload_length = self._get_unique_arxml_child(payload_pdu, 'LENGTH')
         payload_length = parse_number_string(payload_length.text)
@@ -841,39 +1011,39 @@ class SystemLoader:
                                                      autosar_specifics)
 
         # data specifying the SecOC "footer" of a secured frame
-        auth_algo = self._get_unique_arxml_child(pdu, [
+        auth_algo = self._get_unique_arxml_child(pdu, (
             '&AUTHENTICATION-PROPS',
-            'SHORT-NAME' ])
+            'SHORT-NAME' ))
         if auth_algo is not None:
             auth_algo = auth_algo.text
 
-        fresh_algo = self._get_unique_arxml_child(pdu, [
+        fresh_algo = self._get_unique_arxml_child(pdu, (
             '&FRESHNESS-PROPS',
-            'SHORT-NAME' ])
+            'SHORT-NAME' ))
         if fresh_algo is not None:
             fresh_algo = fresh_algo.text
 
-        data_id = self._get_unique_arxml_child(pdu, [
+        data_id = self._get_unique_arxml_child(pdu, (
             'SECURE-COMMUNICATION-PROPS',
-            'DATA-ID' ])
+            'DATA-ID' ))
         if data_id is not None:
             data_id = parse_number_string(data_id.text)
 
-        auth_tx_len = self._get_unique_arxml_child(pdu, [
+        auth_tx_len = self._get_unique_arxml_child(pdu, (
             '&AUTHENTICATION-PROPS',
-            'AUTH-INFO-TX-LENGTH' ])
+            'AUTH-INFO-TX-LENGTH' ))
         if auth_tx_len is not None:
             auth_tx_len = parse_number_string(auth_tx_len.text)
 
-        fresh_len = self._get_unique_arxml_child(pdu, [
+        fresh_len = self._get_unique_arxml_child(pdu, (
             '&FRESHNESS-PROPS',
-            'FRESHNESS-VALUE-LENGTH' ])
+            'FRESHNESS-VALUE-LENGTH' ))
         if fresh_len is not None:
             fresh_len = parse_number_string(fresh_len.text)
 
-        fresh_tx_len = self._get_unique_arxml_child(pdu, [
+        fresh_tx_len = self._get_unique_arxml_child(pdu, (
             '&FRESHNESS-PROPS',
-            'FRESHNESS-VALUE-TX-LENGTH' ])
+            'FRESHNESS-VALUE-TX-LENGTH' ))
         if fresh_tx_len is not None:
             fresh_tx_len = parse_number_string(fresh_tx_len.text)
 
@@ -918,11 +1088,9 @@ class SystemLoader:
 
 
     def _load_pdu(self, pdu, frame_name, next_selector_idx):
-        is_secured = pdu.tag == f'{{{self.xml_namespace}}}SECURED-I-PDU'
-        is_container = pdu.tag == f'{{{self.xml_namespace}}}CONTAINER-I-PDU'
-        is_multiplexed = pdu.tag == f'{{{self.xml_namespace}}}MULTIPLEXED-I-PDU'
+        pdu_tag = pdu.tag
 
-        if is_container:
+        if pdu_tag == self._tag_container_i_pdu:
             max_length = self._get_unique_arxml_child(pdu, 'LENGTH')
             max_length = parse_number_string(max_length.text)
 
@@ -942,11 +1110,11 @@ class SystemLoader:
 
             contained_pdus = \
                 self._get_arxml_children(pdu,
-                                         [
+                                         (
                                              'CONTAINED-PDU-TRIGGERING-REFS',
                                              '*&CONTAINED-PDU-TRIGGERING',
                                              '&I-PDU'
-                                         ])
+                                         ))
             child_pdu_paths = []
             contained_messages = []
             for contained_pdu in contained_pdus:
@@ -960,10 +1128,10 @@ class SystemLoader:
 
                 header_id = \
                     self._get_unique_arxml_child(contained_pdu,
-                                                 [
+                                                 (
                                                      'CONTAINED-I-PDU-PROPS',
                                                      'HEADER-ID-SHORT-HEADER'
-                                                 ])
+                                                 ))
                 header_id = parse_number_string(header_id.text)
 
                 comments = self._load_comments(contained_pdu)
@@ -997,9 +1165,7 @@ class SystemLoader:
                 # create the autosar specifics of the contained_message
                 contained_autosar_specifics = AutosarMessageSpecifics()
                 contained_autosar_specifics._pdu_paths = contained_pdu_paths
-                is_secured = \
-                    (contained_pdu.tag ==
-                     f'{{{self.xml_namespace}}}SECURED-I-PDU')
+                is_secured = (contained_pdu.tag == self._tag_secured_i_pdu)
 
                 # load the data ID of the PDU via its associated
                 # signal group (if it is specified this way)
@@ -1036,12 +1202,12 @@ class SystemLoader:
                 child_pdu_paths, \
                 contained_messages
 
-        elif is_secured:
+        elif pdu_tag == self._tag_secured_i_pdu:
             # secured PDUs reference a payload PDU and some
             # authentication and freshness properties. Currently, we
             # ignore everything except for the payload.
             payload_pdu = \
-                self._get_unique_arxml_child(pdu, [ '&PAYLOAD', '&I-PDU' ])
+                self._get_unique_arxml_child(pdu, ( '&PAYLOAD', '&I-PDU' ))
             assert payload_pdu is not None, \
                 "Secured PDUs must specify a payload PDU!"
 
@@ -1071,39 +1237,23 @@ class SystemLoader:
         if byte_length is not None:
             byte_length = parse_number_string(byte_length.text)
 
-        if self.autosar_version_newer(4):
-            time_period_location = [
-                'I-PDU-TIMING-SPECIFICATIONS',
-                'I-PDU-TIMING',
-                'TRANSMISSION-MODE-DECLARATION',
-                'TRANSMISSION-MODE-TRUE-TIMING',
-                'CYCLIC-TIMING',
-                'TIME-PERIOD',
-                'VALUE',
-            ]
-        else:
-            time_period_location = [
-                'I-PDU-TIMING-SPECIFICATION',
-                'CYCLIC-TIMING',
-                'REPEATING-TIME',
-                'VALUE',
-            ]
-
         time_period = \
-            self._get_unique_arxml_child(pdu, time_period_location)
+            self._get_unique_arxml_child(pdu, self._time_period_location)
 
         cycle_time = None
         if time_period is not None:
             cycle_time = int(float(time_period.text) * 1000)
 
         # ordinary non-multiplexed message
-        signals = self._load_pdu_signals(pdu)
+        signals = list(self._iter_pdu_signals(pdu))
 
-        if is_multiplexed:
+        if pdu_tag == self._tag_multiplexed_i_pdu:
             # multiplexed signals
-            pdu_signals, cycle_time, child_pdu_paths = \
-                self._load_multiplexed_pdu(pdu, frame_name, next_selector_idx)
-            signals.extend(pdu_signals)
+            cycle_time, child_pdu_paths = \
+                self._load_multiplexed_pdu(pdu,
+                                           frame_name,
+                                           next_selector_idx,
+                                           signals)
 
         return \
             next_selector_idx, \
@@ -1113,7 +1263,17 @@ class SystemLoader:
             child_pdu_paths, \
             None
 
-    def _load_multiplexed_pdu(self, pdu, frame_name, next_selector_idx):
+    def _load_multiplexed_pdu(self,
+                              pdu,
+                              frame_name,
+                              next_selector_idx,
+                              signals):
+        """Load the multiplexed part of a PDU.
+
+        The selector signal and the signals of the dynamic and static
+        parts are appended to the given list of signals.
+
+        """
         child_pdu_paths = []
 
         selector_pos = \
@@ -1145,28 +1305,14 @@ class SystemLoader:
         )
         next_selector_idx += 1
 
-        signals = [ selector_signal ]
-
-        if self.autosar_version_newer(4):
-            dynpart_spec = [
-                'DYNAMIC-PARTS',
-                '*DYNAMIC-PART',
-                'DYNAMIC-PART-ALTERNATIVES',
-                '*DYNAMIC-PART-ALTERNATIVE',
-            ]
-        else:
-            dynpart_spec = [
-                'DYNAMIC-PART',
-                'DYNAMIC-PART-ALTERNATIVES',
-                '*DYNAMIC-PART-ALTERNATIVE',
-            ]
+        signals.append(selector_signal)
 
         selector_signal_choices = OrderedDict()
 
         # the cycle time of the message
         cycle_time = None
 
-        for dynalt in self._get_arxml_children(pdu, dynpart_spec):
+        for dynalt in self._get_arxml_children(pdu, self._dynpart_spec):
             dynalt_selector_value = \
                 self._get_unique_arxml_child(dynalt, 'SELECTOR-FIELD-CODE')
             dynalt_selector_value = parse_number_string(dynalt_selector_value.text)
@@ -1209,37 +1355,37 @@ class SystemLoader:
 
             # remove the selector signal from the dynamic part (because it
             # logically is in the static part, despite the fact that AUTOSAR
-            # includes it in every dynamic part)
-            dynalt_selector_signals = \
-                [ x for x in dynalt_signals if x.start == selector_pos ]
-            assert len(dynalt_selector_signals) == 1
-            dselsig = dynalt_selector_signals[0]
-            assert dselsig.start == selector_pos
-            assert dselsig.length == selector_len
-
-            if dynalt_selector_signals[0].choices is not None:
-                selector_signal_choices.update(dynalt_selector_signals[0].choices)
-
-            if dynalt_selector_signals[0].invalid is not None:
-                # TODO: this may lead to undefined behaviour if
-                # multiple PDU define the choices of their selector
-                # signals differently (who does this?)
-                selector_signal.invalid = dynalt_selector_signals[0].invalid
-
-            dynalt_signals.remove(dynalt_selector_signals[0])
-
-            # copy the non-selector signals into the list of signals
-            # for the PDU. TODO: It would be nicer if the hierarchic
-            # structure of the message could be preserved, but this
-            # would require a major change in the database format.
+            # includes it in every dynamic part) and copy the non-selector
+            # signals into the list of signals for the PDU. TODO: It would
+            # be nicer if the hierarchic structure of the message could be
+            # preserved, but this would require a major change in the
+            # database format.
+            dselsig = None
             for sig in dynalt_signals:
+                if sig.start == selector_pos:
+                    assert dselsig is None
+                    dselsig = sig
+                    continue
+
                 # if a given signal is not already under the wings of
                 # a sub-multiplexer signal, we claim it for ourselfs
                 if sig.multiplexer_signal is None:
                     sig.multiplexer_signal = selector_signal.name
                     sig.multiplexer_ids = [ dynalt_selector_value ]
 
-            signals.extend(dynalt_signals)
+                signals.append(sig)
+
+            assert dselsig is not None
+            assert dselsig.length == selector_len
+
+            if dselsig.choices is not None:
+                selector_signal_choices.update(dselsig.choices)
+
+            if dselsig.invalid is not None:
+                # TODO: this may lead to undefined behaviour if
+                # multiple PDU define the choices of their selector
+                # signals differently (who does this?)
+                selector_signal.invalid = dselsig.invalid
 
             # TODO: the cycle time of the multiplexers can be
             # specified indepently of that of the message. how should
@@ -1260,20 +1406,8 @@ class SystemLoader:
             selector_signal.invalid = selector_signal.raw_to_scaled(selector_signal.raw_invalid)
 
         # the static part of the multiplexed PDU
-        if self.autosar_version_newer(4):
-            static_pdu_refs_spec = [
-                'STATIC-PARTS',
-                '*STATIC-PART',
-                'I-PDU-REF',
-            ]
-        else:
-            static_pdu_refs_spec = [
-                'STATIC-PART',
-                'I-PDU-REF',
-            ]
-
-        for static_pdu_ref in self._get_arxml_children(pdu,
-                                                       static_pdu_refs_spec):
+        for static_pdu_ref in \
+                self._get_arxml_children(pdu, self._static_pdu_refs_spec):
             static_pdu_path = \
                 self._get_absolute_arxml_path(pdu,
                                               static_pdu_ref.text,
@@ -1296,50 +1430,34 @@ class SystemLoader:
             child_pdu_paths.extend(static_child_pdu_paths)
             signals.extend(static_signals)
 
-        return signals, cycle_time, child_pdu_paths
+        return cycle_time, child_pdu_paths
 
-    def _load_pdu_signals(self, pdu):
-        signals = []
+    def _iter_pdu_signals(self, pdu):
+        """Yield the signals which are directly mapped to a PDU.
 
-        if self.autosar_version_newer(4):
-            # in AR4, "normal" PDUs use I-SIGNAL-TO-PDU-MAPPINGS whilst network
-            # management PDUs use I-SIGNAL-TO-I-PDU-MAPPINGS
-            i_signal_to_i_pdu_mappings = \
-                self._get_arxml_children(pdu,
-                                         [
-                                             'I-SIGNAL-TO-PDU-MAPPINGS',
-                                             '*&I-SIGNAL-TO-I-PDU-MAPPING'
-                                         ])
-            i_signal_to_i_pdu_mappings.extend(
-                self._get_arxml_children(pdu,
-                                         [
-                                             'I-SIGNAL-TO-I-PDU-MAPPINGS',
-                                             '*&I-SIGNAL-TO-I-PDU-MAPPING'
-                                         ]))
-        else:
-            # in AR3, "normal" PDUs use SIGNAL-TO-PDU-MAPPINGS whilst network
-            # management PDUs use I-SIGNAL-TO-I-PDU-MAPPINGS
-            i_signal_to_i_pdu_mappings = \
-                self._get_arxml_children(pdu,
-                                         [
-                                             'SIGNAL-TO-PDU-MAPPINGS',
-                                             '*&I-SIGNAL-TO-I-PDU-MAPPING'
-                                         ])
-
-            i_signal_to_i_pdu_mappings.extend(
-                self._get_arxml_children(pdu,
-                                         [
-                                             'I-SIGNAL-TO-I-PDU-MAPPINGS',
-                                             '*&I-SIGNAL-TO-I-PDU-MAPPING'
-                                         ]))
+        """
+        # the mappings of both kinds of mapping containers are
+        # collected within a single pass over the children of the PDU
+        seen_tags = set()
+        for child in pdu:
+            if child.tag not in self._signal_to_pdu_mappings_tags:
+                continue
 
-        for i_signal_to_i_pdu_mapping in i_signal_to_i_pdu_mappings:
-            signal = self._load_signal(i_signal_to_i_pdu_mapping)
+            # each kind of mapping container ought to be unique
+            if child.tag in seen_tags:
+                child_tag_name = child.tag[len(self._ns_prefix):]
+                raise ValueError(f'Encountered a a non-unique child node '
+                                 f'of type {child_tag_name} which ought to '
+                                 f'be unique')
+            seen_tags.add(child.tag)
 
-            if signal is not None:
-                signals.append(signal)
+            for i_signal_to_i_pdu_mapping in \
+                    self._get_arxml_children(child,
+                                             '*&I-SIGNAL-TO-I-PDU-MAPPING'):
+                signal = self._load_signal(i_signal_to_i_pdu_mapping)
 
-        return signals
+                if signal is not None:
+                    yield signal
 
     def _load_message_name(self, can_frame_triggering):
         return self._get_unique_arxml_child(can_frame_triggering,
@@ -1364,18 +1482,21 @@ class SystemLoader:
                      else can_addressing_mode.text == 'EXTENDED'
 
     def _load_comments(self, node):
-        result = {}
-
-        for l_2 in self._get_arxml_children(node, ['DESC', '*L-2']):
-            if l_2.text is None:
-                continue
+        desc = self._get_unique_arxml_child(node, 'DESC')
 
-            lang = l_2.attrib.get('L', 'EN')
+        if desc is None:
+            return None
 
-            # remove leading and trailing white space from each line
-            # of multi-line comments
-            tmp = [ x.strip() for x in l_2.text.split('\n') ]
-            result[lang] = '\n'.join(tmp)
+        # remove leading and trailing white space from each line
+        # of multi-line comments. there are only a handful of
+        # distinct language codes, so the keys are interned to let
+        # all comment dictionaries share them.
+        result = {
+            sys.intern(l_2.attrib.get('L', 'EN')):
+                '\n'.join([ x.strip() for x in l_2.text.split('\n') ])
+            for l_2 in desc.iterfind(self._tag_l_2)
+            if l_2.text is not None
+        }
 
         if len(result) == 0:
             return None
@@ -1392,11 +1513,11 @@ class SystemLoader:
         # the signal group associated with this message
         signal_group = \
             self._get_arxml_children(pdu,
-                                     [
+                                     (
                                          'I-SIGNAL-TO-PDU-MAPPINGS',
                                          '*I-SIGNAL-TO-I-PDU-MAPPING',
                                          '&I-SIGNAL-GROUP',
-                                     ])
+                                     ))
 
         if len(signal_group) == 0:
             return
@@ -1406,29 +1527,29 @@ class SystemLoader:
             pass
         signal_group = signal_group[-1]
 
-        trans_props = self._get_unique_arxml_child(signal_group, [
+        trans_props = self._get_unique_arxml_child(signal_group, (
                 'TRANSFORMATION-I-SIGNAL-PROPSS',
                 'END-TO-END-TRANSFORMATION-I-SIGNAL-PROPS',
                 'END-TO-END-TRANSFORMATION-I-SIGNAL-PROPS-VARIANTS',
                 'END-TO-END-TRANSFORMATION-I-SIGNAL-PROPS-CONDITIONAL',
-            ])
+            ))
 
         if trans_props is None:
             return
 
-        profile_name_elem = self._get_unique_arxml_child(trans_props, [
+        profile_name_elem = self._get_unique_arxml_child(trans_props, (
             '&TRANSFORMER',
             'TRANSFORMATION-DESCRIPTIONS',
             'END-TO-END-TRANSFORMATION-DESCRIPTION',
-            'PROFILE-NAME',])
+            'PROFILE-NAME',))
 
         category = None
         if profile_name_elem is not None:
             category = profile_name_elem.text
 
-        did_elems = self._get_arxml_children(trans_props, [
+        did_elems = self._get_arxml_children(trans_props, (
                 'DATA-IDS',
-                '*DATA-ID'])
+                '*DATA-ID'))
         data_ids = []
         for did_elem in did_elems:
             data_ids.append(parse_number_string(did_elem.text))
@@ -1457,7 +1578,7 @@ class SystemLoader:
         system_signal = self._get_unique_arxml_child(i_signal, '&SYSTEM-SIGNAL')
 
         if system_signal is not None \
-           and system_signal.tag != f'{{{self.xml_namespace}}}SYSTEM-SIGNAL':
+           and system_signal.tag != self._tag_system_signal:
             return None
 
         # Default values.
@@ -1471,28 +1592,32 @@ class SystemLoader:
         comments = None
         receivers = []
 
-        if self.autosar_version_newer(4):
-            i_signal_spec = '&I-SIGNAL'
-        else:
-            i_signal_spec = '&SIGNAL'
-
-        i_signal = self._get_unique_arxml_child(i_signal_to_i_pdu_mapping,
-                                                i_signal_spec)
         # Name, start position, length and byte order.
-        name = self._load_signal_name(i_signal)
-
-        start_position = \
-            self._load_signal_start_position(i_signal_to_i_pdu_mapping)
-        length = self._load_signal_length(i_signal, system_signal)
-        byte_order = self._load_signal_byte_order(i_signal_to_i_pdu_mapping)
+        name, start_position, length, byte_order = \
+            self._load_signal_basics(i_signal,
+                                     i_signal_to_i_pdu_mapping,
+                                     system_signal)
 
         # Type.
         is_signed, is_float = self._load_signal_type(i_signal)
 
         if system_signal is not None:
             # Minimum, maximum, factor, offset and choices.
+            cache_key = (system_signal, is_float)
+            system_signal_props = self._system_signal_cache.get(cache_key)
+            if system_signal_props is None:
+                system_signal_props = \
+                    self._load_system_signal(system_signal, is_float)
+                self._system_signal_cache[cache_key] = system_signal_props
+
             minimum, maximum, factor, offset, choices, unit, comments = \
-                self._load_system_signal(system_signal, is_float)
+                system_signal_props
+
+            # the dictionaries and the named values are owned by the
+            # signal, i.e., they must not be shared with other signals
+            choices = _copy_choices(choices)
+            if comments is not None:
+                comments = comments.copy()
 
         # loading initial values is way too complicated, so it is the
         # job of a separate method
@@ -1530,64 +1655,170 @@ class SystemLoader:
         )
         return signal
 
-    def _load_signal_name(self, i_signal):
-        system_signal_name_elem = \
-            self._get_unique_arxml_child(i_signal,
-                                         [
-                                             '&SYSTEM-SIGNAL',
-                                             'SHORT-NAME'
-                                         ])
-        if system_signal_name_elem is not None and len(system_signal_name_elem):
-            return system_signal_name_elem.text
+    def _load_signal_basics(self,
+                            i_signal,
+                            i_signal_to_i_pdu_mapping,
+                            system_signal):
+        """Load the name, start position, length and byte order of a
+        signal.
 
-        return self._get_unique_arxml_child(i_signal, 'SHORT-NAME').text
+        The children of the I-SIGNAL, of the system signal and of the
+        mapping to the PDU are each only scanned once for all of these
+        values.
 
-    def _load_signal_start_position(self, i_signal_to_i_pdu_mapping):
-        pos = self._get_unique_arxml_child(i_signal_to_i_pdu_mapping,
-                                           'START-POSITION').text
-        return parse_number_string(pos)
+        """
+        name, length = self._load_signal_name_and_length(i_signal,
+                                                         system_signal)
+        start_position, byte_order = \
+            self._load_signal_placement(i_signal_to_i_pdu_mapping)
+
+        return name, start_position, length, byte_order
+
+    def _load_signal_name_and_length(self, i_signal, system_signal):
+        tags = (self._tag_short_name, self._tag_length)
+        i_signal_children = self._get_unique_arxml_children_by_tag(i_signal,
+                                                                   tags)
+        name = i_signal_children.get(self._tag_short_name).text
+        length = None
+        i_signal_length = i_signal_children.get(self._tag_length)
+        if i_signal_length is not None:
+            length = parse_number_string(i_signal_length.text)
 
-    def _load_signal_length(self, i_signal, system_signal):
-        i_signal_length = self._get_unique_arxml_child(i_signal, 'LENGTH')
+        if system_signal is not None:
+            system_signal_children = \
+                self._get_unique_arxml_children_by_tag(system_signal, tags)
+            system_signal_name_elem = \
+                system_signal_children.get(self._tag_short_name)
+            if system_signal_name_elem is not None \
+               and len(system_signal_name_elem):
+                name = system_signal_name_elem.text
+
+            if length is None and not self._is_ar4:
+                # AUTOSAR3 supports specifying the signal length via the
+                # system signal. (AR4 does not.)
+                system_signal_length = \
+                    system_signal_children.get(self._tag_length)
+
+                if system_signal_length is not None:
+                    # get the length from the system signal.
+                    length = parse_number_string(system_signal_length.text)
+
+        return name, length
+
+    def _load_signal_placement(self, i_signal_to_i_pdu_mapping):
+        mapping_children = \
+            self._get_unique_arxml_children_by_tag(
+                i_signal_to_i_pdu_mapping,
+                (self._tag_start_position, self._tag_packing_byte_order))
+
+        start_position = parse_number_string(
+            mapping_children.get(self._tag_start_position).text)
 
-        if i_signal_length is not None:
-            return parse_number_string(i_signal_length.text)
+        packing_byte_order = \
+            mapping_children.get(self._tag_packing_byte_order)
+        if packing_byte_order is not None \
+           and packing_byte_order.text == 'MOST-SIGNIFICANT-BYTE-FIRST':
+            byte_order = 'big_endian'
+        else:
+            byte_order = 'little_endian'
+
+        return start_position, byte_order
+
+    # the loaders of the individual basic properties of a signal. They
+    # are not used by _load_signal() anymore, see _load_signal_basics().
+    def _load_signal_name(self, i_signal):
+        system_signal = self._get_unique_arxml_child(i_signal, '&SYSTEM-SIGNAL')
+        return self._load_signal_name_and_length(i_signal, system_signal)[0]
 
-        if not self.autosar_version_newer(4) and system_signal is not None:
-            # AUTOSAR3 supports specifying the signal length via the
-            # system signal. (AR4 does not.)
-            system_signal_length = \
-                self._get_unique_arxml_child(system_signal, 'LENGTH')
+    def _load_signal_start_position(self, i_signal_to_i_pdu_mapping):
+        return self._load_signal_placement(i_signal_to_i_pdu_mapping)[0]
 
-            if system_signal_length is not None:
-                # get the length from the system signal.
-                return parse_number_string(system_signal_length.text)
+    def _load_signal_length(self, i_signal, system_signal):
+        return self._load_signal_name_and_length(i_signal, system_signal)[1]
 
-        return None # error?!
+    def _load_signal_byte_order(self, i_signal_to_i_pdu_mapping):
+        return self._load_signal_placement(i_signal_to_i_pdu_mapping)[1]
 
-    def _load_arxml_init_value_string(self, i_signal, system_signal):
-        """"Load the initial value of a signal
+    def _load_arxml_init_value_string_ar4(self, i_signal, system_signal):
+        """"Load the initial value of an AUTOSAR 4 signal
 
         Supported mechanisms are references to constants and direct
         specifcation of the value. Note that this method returns a
         string which must be converted into the signal's data type by
         the calling code.
         """
+        if i_signal is None:
+            return None
 
-        # AUTOSAR3 specifies the signal's initial value via
-        # the system signal via the i-signal...
-        if self.autosar_version_newer(4):
-            if i_signal is None:
-                return None
+        init_value = self._get_unique_arxml_child(i_signal, 'INIT-VALUE')
 
-            return self._load_arxml_init_value_string_helper(i_signal)
-        else:
-            if system_signal is None:
-                return None
+        if init_value is None:
+            # no initial value specified
+            return None
 
-            return self._load_arxml_init_value_string_helper(system_signal)
+        value_elem = \
+            self._get_unique_arxml_child(init_value,
+                                         (
+                                            'NUMERICAL-VALUE-SPECIFICATION',
+                                            'VALUE'
+                                         ))
+
+        if value_elem is not None:
+            # initial value is specified directly.
+            return value_elem.text
+
+        value_elem = \
+            self._get_unique_arxml_child(init_value,
+                                         (
+                                            'CONSTANT-REFERENCE',
+                                            '&CONSTANT',
+                                            'VALUE-SPEC',
+                                            'NUMERICAL-VALUE-SPECIFICATION',
+                                            'VALUE'
+                                         ))
+
+        if value_elem is not None:
+            # initial value is specified via a reference to a constant.
+            return value_elem.text
+
+        # no initial value specified or specified in a way which we
+        # don't recognize
+        return None
+
+    def _load_arxml_init_value_string_ar3(self, i_signal, system_signal):
+        """"Load the initial value of an AUTOSAR 3 signal
+
+        AUTOSAR 3 specifies the signal's initial value via the system
+        signal. Like for _load_arxml_init_value_string_ar4(), the
+        value is returned as a string.
+        """
+        if system_signal is None:
+            return None
 
-    def _load_arxml_invalid_int_value(self, i_signal, system_signal):
+        # AR3 seems to specify initial values by means of
+        # INIT-VALUE-REF elements. Unfortunately, these are not
+        # standard references so we have to go down a separate code
+        # path...
+        ref_elem = system_signal.find(self._tag_init_value_ref)
+
+        if ref_elem is None:
+            # no initial value found here
+            return None
+
+        literal_spec = \
+            self._follow_arxml_reference(
+                base_elem=system_signal,
+                arxml_path=ref_elem.text,
+                dest_tag_name=ref_elem.attrib.get('DEST'),
+                refbase_name=ref_elem.attrib.get('BASE'))
+        if literal_spec is None:
+            # dangling reference...
+            return None
+
+        literal_value = literal_spec.find(self._tag_value)
+        return None if literal_value is None else literal_value.text
+
+    def _load_arxml_invalid_int_value_ar4(self, i_signal, system_signal):
         """Load a signal's internal value which indicates that it is not valid
 
         i.e., this returns the value which is transferred over the bus
@@ -1595,147 +1826,72 @@ class SystemLoader:
         only support boolean and integer literals, any other value
         specification will be ignored.
         """
-
-        if self.autosar_version_newer(4):
-            invalid_val = \
-                self._get_unique_arxml_child(i_signal,
-                                             [
-                                                 'NETWORK-REPRESENTATION-PROPS',
-                                                 'SW-DATA-DEF-PROPS-VARIANTS',
-                                                 'SW-DATA-DEF-PROPS-CONDITIONAL',
-                                                 'INVALID-VALUE',
-                                                 'NUMERICAL-VALUE-SPECIFICATION',
-                                                 'VALUE',
-                                             ])
-
-            if invalid_val is None:
-                return None
-
-            return parse_number_string(invalid_val.text)
-
-        else:
-            invalid_val = \
-                self._get_unique_arxml_child(system_signal,
-                                             [
-                                                 '&DATA-TYPE',
-                                                 'SW-DATA-DEF-PROPS',
-                                                 'INVALID-VALUE'
-                                             ])
-
-            if invalid_val is None:
-                return None
-
-            literal = self._get_unique_arxml_child(invalid_val,
-                                                   [
-                                                       'INTEGER-LITERAL',
-                                                       'VALUE',
-                                                   ])
-            if literal is not None:
-                return parse_number_string(literal.text)
-
-            literal = self._get_unique_arxml_child(invalid_val,
-                                                   [
-                                                       'BOOLEAN-LITERAL',
-                                                       'VALUE',
-                                                   ])
-            if literal is not None:
-                return literal.text.lower().strip() == 'true'
-
+        invalid_val = \
+            self._get_unique_arxml_child(i_signal,
+                                         (
+                                             'NETWORK-REPRESENTATION-PROPS',
+                                             'SW-DATA-DEF-PROPS-VARIANTS',
+                                             'SW-DATA-DEF-PROPS-CONDITIONAL',
+                                             'INVALID-VALUE',
+                                             'NUMERICAL-VALUE-SPECIFICATION',
+                                             'VALUE',
+                                         ))
+
+        if invalid_val is None:
             return None
 
-    def _load_arxml_init_value_string_helper(self, signal_elem):
-        """"Helper function for loading thge initial value of a signal
+        return parse_number_string(invalid_val.text)
+
+    def _load_arxml_invalid_int_value_ar3(self, i_signal, system_signal):
+        """The AUTOSAR 3 variant of _load_arxml_invalid_int_value_ar4()
 
-        This function avoids code duplication between loading the
-        initial signal value from the ISignal and the
-        SystemSignal. (The latter is only supported by AUTOSAR 3.)
         """
-        if self.autosar_version_newer(4):
-            value_elem = \
-                self._get_unique_arxml_child(signal_elem,
-                                             [
-                                                'INIT-VALUE',
-                                                'NUMERICAL-VALUE-SPECIFICATION',
-                                                'VALUE'
-                                             ])
-
-            if value_elem is not None:
-                # initial value is specified directly.
-                return value_elem.text
-
-            value_elem = \
-                self._get_unique_arxml_child(signal_elem,
-                                             [
-                                                'INIT-VALUE',
-                                                'CONSTANT-REFERENCE',
-                                                '&CONSTANT',
-                                                'VALUE-SPEC',
-                                                'NUMERICAL-VALUE-SPECIFICATION',
-                                                'VALUE'
-                                             ])
-
-            if value_elem is not None:
-                # initial value is specified via a reference to a constant.
-                return value_elem.text
-
-            # no initial value specified or specified in a way which we
-            # don't recognize
+        invalid_val = \
+            self._get_unique_arxml_child(system_signal,
+                                         (
+                                             '&DATA-TYPE',
+                                             'SW-DATA-DEF-PROPS',
+                                             'INVALID-VALUE'
+                                         ))
+
+        if invalid_val is None:
             return None
 
-        else:
-            # AUTOSAR3: AR3 seems to specify initial values by means
-            # of INIT-VALUE-REF elements. Unfortunately, these are not
-            # standard references so we have to go down a separate
-            # code path...
-            ref_elem = signal_elem.find(f'./ns:INIT-VALUE-REF',
-                                        self._xml_namespaces)
-
-            if ref_elem is None:
-                # no initial value found here
-                return None
-
-            literal_spec = \
-                self._follow_arxml_reference(
-                    base_elem=signal_elem,
-                    arxml_path=ref_elem.text,
-                    dest_tag_name=ref_elem.attrib.get('DEST'),
-                    refbase_name=ref_elem.attrib.get('BASE'))
-            if literal_spec is None:
-                # dangling reference...
-                return None
-
-            literal_value = \
-                literal_spec.find(f'./ns:VALUE', self._xml_namespaces)
-            return None if literal_value is None else literal_value.text
+        literal = self._get_unique_arxml_child(invalid_val,
+                                               (
+                                                   'INTEGER-LITERAL',
+                                                   'VALUE',
+                                               ))
+        if literal is not None:
+            return parse_number_string(literal.text)
 
-    def _load_signal_byte_order(self, i_signal_to_i_pdu_mapping):
-        packing_byte_order = \
-            self._get_unique_arxml_child(i_signal_to_i_pdu_mapping,
-                                         'PACKING-BYTE-ORDER')
+        literal = self._get_unique_arxml_child(invalid_val,
+                                               (
+                                                   'BOOLEAN-LITERAL',
+                                                   'VALUE',
+                                               ))
+        if literal is not None:
+            return literal.text.lower().strip() == 'true'
 
-        if packing_byte_order is not None \
-           and packing_byte_order.text == 'MOST-SIGNIFICANT-BYTE-FIRST':
-            return 'big_endian'
-        else:
-            return 'little_endian'
+        return None
 
     def _load_system_signal_unit(self, system_signal, compu_method):
         res = self._get_unique_arxml_child(system_signal,
-                                           [
+                                           (
                                                'PHYSICAL-PROPS',
                                                'SW-DATA-DEF-PROPS-VARIANTS',
                                                '&SW-DATA-DEF-PROPS-CONDITIONAL',
                                                '&UNIT',
                                                'DISPLAY-NAME'
-                                           ])
+                                           ))
 
         if res is None and compu_method is not None:
             # try to go via the compu_method
             res = self._get_unique_arxml_child(compu_method,
-                                               [
+                                               (
                                                    '&UNIT',
                                                    'DISPLAY-NAME'
-                                               ])
+                                               ))
 
         ignorelist = ( 'NoUnit', )
 
@@ -1743,20 +1899,21 @@ class SystemLoader:
             return None
         return res.text
 
-    def _load_texttable(self, compu_method):
+    def _load_texttable(self, compu_method, is_float):
         choices = {}
 
         for compu_scale in self._get_arxml_children(compu_method,
-                                                    [
+                                                    (
                                                       '&COMPU-INTERNAL-TO-PHYS',
                                                       'COMPU-SCALES',
                                                       '*&COMPU-SCALE'
-                                                    ]):
-            vt = \
-                self._get_unique_arxml_child(compu_scale, ['&COMPU-CONST', 'VT'])
+                                                    )):
+            lower_limit, upper_limit, compu_const, _ = \
+                self._scan_compu_scale(compu_scale)
+            vt = None if compu_const is None \
+                else self._get_unique_arxml_child(compu_const, 'VT')
 
             # the current scale is an enumeration value
-            lower_limit, upper_limit = self._load_scale_limits(compu_scale)
             assert lower_limit is not None \
                    and lower_limit == upper_limit, \
                    f'Invalid value specified for enumeration {vt}: ' \
@@ -1766,19 +1923,19 @@ class SystemLoader:
             comments = self._load_comments(compu_scale)
             choices[value] = NamedSignalValue(value, name, comments)
 
-        return choices
+        return None, None, 1.0, 0.0, choices
 
-    def _load_linear_scale(self, compu_scale):
+    def _load_linear_scale(self,
+                           compu_rational_coeffs,
+                           lower_limit,
+                           upper_limit):
         # load the scaling factor an offset
-        compu_rational_coeffs = \
-            self._get_unique_arxml_child(compu_scale, '&COMPU-RATIONAL-COEFFS')
-
         if compu_rational_coeffs is None:
             factor = 1.0
             offset = 0.0
         else:
             numerators = self._get_arxml_children(compu_rational_coeffs,
-                                                  ['&COMPU-NUMERATOR', '*&V'])
+                                                  ('&COMPU-NUMERATOR', '*&V'))
 
             if len(numerators) != 2:
                 raise ValueError(
@@ -1786,7 +1943,7 @@ class SystemLoader:
                     f'got {len(numerators)}.')
 
             denominators = self._get_arxml_children(compu_rational_coeffs,
-                                                    ['&COMPU-DENOMINATOR', '*&V'])
+                                                    ('&COMPU-DENOMINATOR', '*&V'))
 
             if len(denominators) != 1:
                 raise ValueError(
@@ -1797,9 +1954,6 @@ class SystemLoader:
             factor = parse_number_string(numerators[1].text, True) / denominator
             offset = parse_number_string(numerators[0].text, True) / denominator
 
-        # load the domain interval of the scale
-        lower_limit, upper_limit = self._load_scale_limits(compu_scale)
-
         # sanity checks
         if lower_limit is not None and \
              upper_limit is not None and \
@@ -1828,34 +1982,70 @@ class SystemLoader:
         offset = 0.0
 
         for compu_scale in self._get_arxml_children(compu_method,
-                                                    [
+                                                    (
                                                         'COMPU-INTERNAL-TO-PHYS',
                                                         'COMPU-SCALES',
                                                         '&COMPU-SCALE'
-                                                    ]):
+                                                    )):
             if minimum is not None or maximum is not None:
                 LOGGER.warning(f'Signal scaling featuring multiple segments '
                                f'is currently unsupported. Expect spurious '
                                f'results!')
 
+            lower_limit, upper_limit, _, compu_rational_coeffs = \
+                self._scan_compu_scale(compu_scale, is_float)
             minimum, maximum, factor, offset = \
-                self._load_linear_scale(compu_scale)
+                self._load_linear_scale(compu_rational_coeffs,
+                                        lower_limit,
+                                        upper_limit)
 
-        return minimum, maximum, factor, offset
+        return minimum, maximum, factor, offset, None
 
-    def _load_scale_limits(self, compu_scale):
-        lower_limit = \
-            self._get_unique_arxml_child(compu_scale, 'LOWER-LIMIT')
-        upper_limit = \
-            self._get_unique_arxml_child(compu_scale, 'UPPER-LIMIT')
+    def _scan_compu_scale(self, compu_scale, is_float=False):
+        """Return the domain limits, the constant and the rational
+        coefficients of a compu scale.
 
-        if lower_limit is not None:
-            lower_limit = parse_number_string(lower_limit.text)
+        The children of the scale are only scanned once for all of
+        them. Anything which is not specified is None. The limits of
+        the scales of floating point signals may be non-integer.
+
+        """
+        lower_limit = None
+        upper_limit = None
+        compu_const = None
+        compu_rational_coeffs = None
+
+        seen_tags = set()
+        for child in compu_scale:
+            child_tag = child.tag
+            if child_tag == self._tag_lower_limit:
+                lower_limit = parse_number_string(child.text, is_float)
+            elif child_tag == self._tag_upper_limit:
+                upper_limit = parse_number_string(child.text, is_float)
+            elif child_tag == self._tag_compu_const:
+                compu_const = child
+            elif child_tag == self._tag_compu_rational_coeffs:
+                compu_rational_coeffs = child
+            elif child_tag in self._compu_scale_ref_tags:
+                # referenced constants or coefficients are rare, so
+                # let the generic machinery deal with them
+                compu_const = \
+                    self._get_unique_arxml_child(compu_scale, '&COMPU-CONST')
+                compu_rational_coeffs = \
+                    self._get_unique_arxml_child(compu_scale,
+                                                 '&COMPU-RATIONAL-COEFFS')
+                continue
+            else:
+                continue
 
-        if upper_limit is not None:
-            upper_limit = parse_number_string(upper_limit.text)
+            # each of the children handled above ought to be unique
+            if child_tag in seen_tags:
+                child_tag_name = child_tag[len(self._ns_prefix):]
+                raise ValueError(f'{child_tag_name} does not resolve into a '
+                                 f'unique node')
+            seen_tags.add(child_tag)
 
-        return lower_limit, upper_limit
+        return lower_limit, upper_limit, compu_const, compu_rational_coeffs
 
     def _load_scale_linear_and_texttable(self, compu_method, is_float):
         minimum = None
@@ -1865,18 +2055,19 @@ class SystemLoader:
         choices = {}
 
         for compu_scale in self._get_arxml_children(compu_method,
-                                                    [
+                                                    (
                                                       '&COMPU-INTERNAL-TO-PHYS',
                                                       'COMPU-SCALES',
                                                       '*&COMPU-SCALE'
-                                                    ]):
+                                                    )):
 
-            vt = \
-               self._get_unique_arxml_child(compu_scale, ['&COMPU-CONST', 'VT'])
+            lower_limit, upper_limit, compu_const, compu_rational_coeffs = \
+                self._scan_compu_scale(compu_scale, is_float)
+            vt = None if compu_const is None \
+                else self._get_unique_arxml_child(compu_const, 'VT')
 
             if vt is not None:
                 # the current scale is an enumeration value
-                lower_limit, upper_limit = self._load_scale_limits(compu_scale)
                 assert(lower_limit is not None \
                        and lower_limit == upper_limit)
                 value = lower_limit
@@ -1898,7 +2089,9 @@ class SystemLoader:
                 # and offsets are specified. For now, let's just
                 # assume that the ARXML file is well formed.
                 minimum, maximum, factor, offset = \
-                    self._load_linear_scale(compu_scale)
+                    self._load_linear_scale(compu_rational_coeffs,
+                                            lower_limit,
+                                            upper_limit)
 
         return minimum, maximum, factor, offset, choices
 
@@ -1931,19 +2124,21 @@ class SystemLoader:
                         comments)
 
             category = category.text
+            load_compu_method = self._compu_method_loaders.get(category)
 
-            if category == 'TEXTTABLE':
-                choices = self._load_texttable(compu_method)
-            elif category == 'LINEAR':
-                minimum, maximum, factor, offset = \
-                    self._load_linear(compu_method,  is_float)
-            elif category == 'SCALE_LINEAR_AND_TEXTTABLE':
-                (minimum,
-                 maximum,
-                 factor,
-                 offset,
-                 choices) = self._load_scale_linear_and_texttable(compu_method,
-                                                                  is_float)
+            if load_compu_method is not None:
+                cache_key = (compu_method, is_float)
+                compu_method_props = self._compu_method_cache.get(cache_key)
+                if compu_method_props is None:
+                    compu_method_props = \
+                        load_compu_method(compu_method, is_float)
+                    self._compu_method_cache[cache_key] = compu_method_props
+
+                minimum, maximum, factor, offset, choices = compu_method_props
+
+                # the named values are mutable, so the cached ones
+                # must not be shared between system signals
+                choices = _copy_choices(choices)
             else:
                 LOGGER.debug('Compu method category %s is not yet implemented.',
                              category)
@@ -1958,37 +2153,21 @@ class SystemLoader:
             comments
 
     def _load_signal_type(self, i_signal):
-        is_signed = False
-        is_float = False
-
         base_type = self._get_sw_base_type(i_signal)
 
-        if base_type is not None:
-            base_type_encoding = \
-                self._get_unique_arxml_child(base_type, '&BASE-TYPE-ENCODING')
-
-            if base_type_encoding is None:
-                btt = base_type.find('./ns:SHORT-NAME', self._xml_namespaces)
-                btt = btt.text
-                raise ValueError(
-                    f'BASE-TYPE-ENCODING in base type "{btt}" does not exist.')
+        if base_type is None:
+            return False, False
 
-            base_type_encoding = base_type_encoding.text
+        base_type_encoding = \
+            self._get_unique_arxml_child(base_type, '&BASE-TYPE-ENCODING')
 
-            if base_type_encoding in ('2C', '1C', 'SM'):
-                # types which use two-complement, one-complement or
-                # sign+magnitude encodings are signed. TODO (?): The
-                # fact that if anything other than two complement
-                # notation is used for negative numbers is not
-                # reflected anywhere. In practice this should not
-                # matter, though, since two-complement notation is
-                # basically always used for systems build after
-                # ~1970...
-                is_signed = True
-            elif base_type_encoding == 'IEEE754':
-                is_float = True
+        if base_type_encoding is None:
+            btt = base_type.find(self._tag_short_name)
+            btt = btt.text
+            raise ValueError(
+                f'BASE-TYPE-ENCODING in base type "{btt}" does not exist.')
 
-        return is_signed, is_float
+        return _ENCODING_FLAGS.get(base_type_encoding.text, (False, False))
 
     def _get_absolute_arxml_path(self,
                                  base_elem,
@@ -2003,25 +2182,16 @@ class SystemLoader:
             # path is already absolute
             return arxml_path
 
-        base_path = self._node_to_arxml_path[base_elem]
-        base_path_atoms = base_path.split("/")
+        package_path = self._node_to_package_path[base_elem]
 
         # Find the absolute path specified by the applicable
         # reference base. The spec says the matching reference
         # base for the "closest" package should be used, so we
-        # traverse the ARXML path of the base element in reverse
-        # to find the first package with a matching reference
-        # base.
+        # traverse the enclosing packages of the base element from
+        # the inside out to find the first package with a matching
+        # reference base.
         refbase_path = None
-        for i in range(len(base_path_atoms), 0, -1):
-            test_path = '/'.join(base_path_atoms[0:i])
-            test_node = self._arxml_path_to_node.get(test_path)
-            if test_node is not None \
-               and test_node.tag  != f'{{{self.xml_namespace}}}AR-PACKAGE':
-                # the referenced XML node does not represent a
-                # package
-                continue
-
+        for test_path in self._package_path_chains[package_path]:
             if refbase_name is None:
                 # the caller did not specify a BASE attribute,
                 # i.e., we ought to use the closest default
@@ -2064,21 +2234,35 @@ class SystemLoader:
         exists, a None object is returned.
         """
 
-        arxml_path = self._get_absolute_arxml_path(base_elem,
-                                                   arxml_path,
-                                                   refbase_name)
+        # the same few elements are referenced over and over again,
+        # so the results are cached. the base element and the
+        # reference base only matter for relative references.
+        if arxml_path.startswith('/'):
+            cache_key = (None, arxml_path, dest_tag_name, None)
+        else:
+            cache_key = (base_elem, arxml_path, dest_tag_name, refbase_name)
 
+        try:
+            return self._reference_cache[cache_key]
+        except KeyError:
+            pass
+
+        abs_arxml_path = self._get_absolute_arxml_path(base_elem,
+                                                       arxml_path,
+                                                       refbase_name)
 
         # resolve the absolute reference: This is simple because we
         # have a path -> XML node dictionary!
-        result = self._arxml_path_to_node.get(arxml_path)
+        result = self._arxml_path_to_node.get(abs_arxml_path)
 
         if result is not None \
            and dest_tag_name is not None \
-           and result.tag != f'{{{self.xml_namespace}}}{dest_tag_name}':
+           and result.tag != self._ns_prefix + dest_tag_name:
             # the reference could be resolved but it lead to a node of
             # unexpected kind
-            return None
+            result = None
+
+        self._reference_cache[cache_key] = result
 
         return result
 
@@ -2089,15 +2273,31 @@ class SystemLoader:
         self._package_default_refbase_path = {}
         # given a package name, produce a refbase label to ARXML path dictionary
         self._package_refbase_paths = {}
-
-        def add_sub_references(elem, elem_path, cur_package_path=""):
-            """Recursively add all ARXML references contained within an XML
-            element to the dictionaries to handle ARXML references"""
+        # the path of the innermost package which contains a given node
+        self._node_to_package_path = {}
+        # given a package path, produce the paths of the package and
+        # of all packages which enclose it, innermost first
+        self._package_path_chains = { '': ('', ) }
+        # (base element, reference, destination tag, refbase label) ->
+        # XML node dictionary of the references resolved so far
+        self._reference_cache = {}
+
+        def add_sub_references(elem, elem_path, cur_package_path):
+            """Add the ARXML references of an XML element to the
+            dictionaries to handle ARXML references and return the
+            ARXML path and the package path for its children"""
 
             # check if a short name has been attached to the current
             # element. If yes update the ARXML path for this element
-            # and its children
-            short_name = elem.find(f'ns:SHORT-NAME', self._xml_namespaces)
+            # and its children. According to the AUTOSAR schema, the
+            # short name is always the first child, so only other
+            # kinds of first children (i.e., XML comments) require a
+            # search.
+            short_name = elem[0]
+            if short_name.tag != self._tag_short_name:
+                short_name = \
+                    None if isinstance(short_name.tag, str) \
+                    else elem.find(self._tag_short_name)
 
             if short_name is not None:
                 short_name = short_name.text
@@ -2109,25 +2309,41 @@ class SystemLoader:
 
                 self._arxml_path_to_node[elem_path] = elem
 
-            # register the ARXML path name of the current element
-            self._node_to_arxml_path[elem] = elem_path
+                # register the ARXML path name of the current
+                # element. Elements without a short name cannot be
+                # referenced and share the path of their parent, so
+                # there is no need to keep track of them.
+                self._node_to_arxml_path[elem] = elem_path
 
             # if the current element is a package, update the ARXML
             # package path
-            if elem.tag == f'{{{self.xml_namespace}}}AR-PACKAGE':
+            if elem.tag == self._tag_ar_package:
+                parent_package_path = cur_package_path
                 cur_package_path = f'{cur_package_path}/{short_name}'
+                self._package_path_chains[cur_package_path] = \
+                    (cur_package_path, ) + \
+                    self._package_path_chains[parent_package_path]
 
-            # handle reference bases (for relative references)
-            if elem.tag == f'{{{self.xml_namespace}}}REFERENCE-BASE':
-                refbase_name = elem.find('./ns:SHORT-LABEL',
-                                         self._xml_namespaces).text.strip()
-                refbase_path = elem.find('./ns:PACKAGE-REF',
-                                         self._xml_namespaces).text.strip()
-
-                is_default = elem.find('./ns:IS-DEFAULT', self._xml_namespaces)
+            self._node_to_package_path[elem] = cur_package_path
 
-                if is_default is not None:
-                    is_default = (is_default.text.strip().lower() == "true")
+            # handle reference bases (for relative references)
+            if elem.tag == self._tag_reference_base:
+                refbase_name = None
+                refbase_path = None
+                is_default = None
+                is_global = None
+                # the same few reference bases are usually specified
+                # by many packages, so their names and paths are
+                # interned to share the strings
+                for child in elem:
+                    if child.tag == self._tag_short_label:
+                        refbase_name = sys.intern(child.text.strip())
+                    elif child.tag == self._tag_package_ref:
+                        refbase_path = sys.intern(child.text.strip())
+                    elif child.tag == self._tag_is_default:
+                        is_default = (child.text.strip().lower() == "true")
+                    elif child.tag == self._tag_is_global:
+                        is_global = (child.text.strip().lower() == "true")
 
                 current_default_refbase_path = \
                     self._package_default_refbase_path.get(cur_package_path)
@@ -2140,11 +2356,6 @@ class SystemLoader:
                     self._package_default_refbase_path[cur_package_path] = \
                         refbase_path
 
-                is_global = elem.find('./ns:IS-GLOBAL', self._xml_namespaces)
-
-                if is_global is not None:
-                    is_global = (is_global.text.strip().lower() == "true")
-
                 if is_global:
                     raise ValueError(f'Non-canonical relative references are '
                                      f'not yet supported.')
@@ -2160,18 +2371,37 @@ class SystemLoader:
                 self._package_refbase_paths[cur_package_path][refbase_name] = \
                     refbase_path
 
-            # iterate over all children and add all references contained therein
-            for child in elem:
-                add_sub_references(child, elem_path, cur_package_path)
+            return elem_path, cur_package_path
 
+        # ARXML files can be deeply nested and huge, so the element
+        # tree is walked using an explicit stack instead of recursion
         self._arxml_path_to_node = {}
-        add_sub_references(self._root, '')
+        node_to_package_path = self._node_to_package_path
+        stack = [ (self._root, '', '') ] if len(self._root) else []
+        while stack:
+            elem, elem_path, cur_package_path = stack.pop()
+            elem_path, cur_package_path = \
+                add_sub_references(elem, elem_path, cur_package_path)
+
+            # add all references contained within the children. (they
+            # are pushed in reverse order to keep the document order.)
+            # Elements without children of their own, i.e., the bulk
+            # of the document, can neither exhibit a short name nor be
+            # a package or a reference base. They may be reference
+            # elements, though, which are resolved relative to
+            # themselves (e.g., PDU-REF), so only their package path
+            # is recorded.
+            for child in reversed(elem):
+                if len(child):
+                    stack.append((child, elem_path, cur_package_path))
+                else:
+                    node_to_package_path[child] = cur_package_path
 
     def _get_arxml_children(self, base_elems, children_location):
         """Locate a set of ElementTree child nodes at a given location.
 
         This is a method that retrieves a list of ElementTree nodes
-        that match a given ARXML location. An ARXML location is a list
+        that match a given ARXML location. An ARXML location is a tuple
         of strings that specify the nesting order of the XML tag
         names; potential references for entries are preceeded by an
         '&': If a sub-element exhibits the specified name, it is used
@@ -2181,7 +2411,9 @@ class SystemLoader:
         location specification is relative to the result of that
         resolution. If a location atom is preceeded by '*', then
         multiple sub-elements are possible. The '&' and '*' qualifiers
-        may be combined.
+        may be combined. The qualifiers are only parsed once per
+        location, so locations should be tuples of string literals,
+        which Python stores as constants.
 
         Example:
 
@@ -2192,14 +2424,14 @@ class SystemLoader:
           # channel and its individual frame triggerings can be
           # references
           loader._get_arxml_children(can_cluster,
-                                     [
+                                     (
                                          'CAN-CLUSTER-VARIANTS',
                                          '*&CAN-CLUSTER-CONDITIONAL',
                                          'PHYSICAL-CHANNELS',
                                          '*&CAN-PHYSICAL-CHANNEL',
                                          'FRAME-TRIGGERINGS',
                                          '*&CAN-FRAME-TRIGGERING'
-                                     ])
+                                     ))
 
         """
 
@@ -2207,46 +2439,36 @@ class SystemLoader:
             raise ValueError(
                 'Cannot retrieve a child element of a non-existing node!')
 
-        # make sure that the children_location is a list. for convenience we
-        # also allow it to be a string. In this case we take it that a
-        # direct child node needs to be found.
-        if isinstance(children_location, str):
-            children_location = [ children_location ]
+        if isinstance(children_location, list):
+            children_location = tuple(children_location)
+
+        steps = _compile_arxml_location(self.xml_namespace, children_location)
 
         # make sure that the base elements are iterable. for
         # convenience we also allow it to be an individiual node.
-        if type(base_elems).__name__ == 'Element':
+        if isinstance(base_elems, _ELEMENT_TYPES):
             base_elems = [base_elems]
 
-        for child_tag_name in children_location:
+        for child_tag_name, ctt, cttr, is_nodeset in steps:
 
             if len(base_elems) == 0:
                 return [] # the base elements left are the empty set...
 
-            # handle the set and reference specifiers of the current
-            # sub-location
-            allow_references = '&' in child_tag_name[:2]
-            is_nodeset = '*' in child_tag_name[:2]
-
-            if allow_references:
-                child_tag_name = child_tag_name[1:]
-
-            if is_nodeset:
-                child_tag_name = child_tag_name[1:]
-
-            # traverse the specified path one level deeper
+            # traverse the specified path one level deeper. the
+            # matches are directly collected in the result list; for
+            # non-nodeset locations, the number of matches per base
+            # element is checked using the length of the list.
             result = []
+            append = result.append
 
             for base_elem in base_elems:
-                local_result = []
+                num_results_before = len(result)
 
                 for child_elem in base_elem:
-                    ctt = f'{{{self.xml_namespace}}}{child_tag_name}'
-                    cttr = f'{{{self.xml_namespace}}}{child_tag_name}-REF'
-
-                    if child_elem.tag == ctt:
-                        local_result.append(child_elem)
-                    elif child_elem.tag == cttr:
+                    child_tag = child_elem.tag
+                    if child_tag == ctt:
+                        append(child_elem)
+                    elif child_tag == cttr:
                         tmp = self._follow_arxml_reference(
                             base_elem=base_elem,
                             arxml_path=child_elem.text,
@@ -2259,15 +2481,13 @@ class SystemLoader:
                                              f'"{child_elem.attrib.get("DEST")}": '
                                              f'{child_elem.text}')
 
-                        local_result.append(tmp)
+                        append(tmp)
 
-                if not is_nodeset and len(local_result) > 1:
+                if not is_nodeset and len(result) - num_results_before > 1:
                     raise ValueError(f'Encountered a a non-unique child node '
                                      f'of type {child_tag_name} which ought to '
                                      f'be unique')
 
-                result.extend(local_result)
-
             base_elems = result
 
         return base_elems
@@ -2281,6 +2501,23 @@ class SystemLoader:
         object can be used directly if the corresponding node is
         assumed to be present.
         """
+
+        # fast path for the common case of a direct child which cannot
+        # be a reference
+        if isinstance(child_location, str) \
+           and child_location[0] not in '&*' \
+           and isinstance(base_elem, _ELEMENT_TYPES):
+            child_tag = self._ns_prefix + child_location
+            result = None
+            for child_elem in base_elem:
+                if child_elem.tag == child_tag:
+                    if result is not None:
+                        raise ValueError(f'{child_location} does not resolve '
+                                         f'into a unique node')
+                    result = child_elem
+
+            return result
+
         tmp = self._get_arxml_children(base_elem, child_location)
 
         if len(tmp) == 0:
@@ -2291,32 +2528,48 @@ class SystemLoader:
             raise ValueError(f'{child_location} does not resolve into a '
                              f'unique node')
 
+    def _get_unique_arxml_children_by_tag(self, base_elem, child_tags):
+        """Return a dictionary which maps the given fully qualified
+        tags to the direct children of an element that feature them.
+
+        The children are scanned only once for all tags. Like
+        _get_unique_arxml_child(), this raises ValueError if any of
+        the tags is featured by more than one child.
+        """
+        result = {}
+        for child_elem in base_elem:
+            child_tag = child_elem.tag
+            if child_tag in child_tags:
+                if child_tag in result:
+                    child_tag_name = child_tag[len(self._ns_prefix):]
+                    raise ValueError(f'{child_tag_name} does not resolve '
+                                     f'into a unique node')
+                result[child_tag] = child_elem
+
+        return result
+
     def _get_can_frame(self, can_frame_triggering):
         return self._get_unique_arxml_child(can_frame_triggering, '&FRAME')
 
     def _get_i_signal(self, i_signal_to_i_pdu_mapping):
-        if self.autosar_version_newer(4):
-            return self._get_unique_arxml_child(i_signal_to_i_pdu_mapping,
-                                                '&I-SIGNAL')
-        else:
-            return self._get_unique_arxml_child(i_signal_to_i_pdu_mapping,
-                                                '&SIGNAL')
+        return self._get_unique_arxml_child(i_signal_to_i_pdu_mapping,
+                                            self._i_signal_spec)
 
     def _get_pdu(self, can_frame):
         return self._get_unique_arxml_child(can_frame,
-                                            [
+                                            (
                                                 'PDU-TO-FRAME-MAPPINGS',
                                                 '&PDU-TO-FRAME-MAPPING',
                                                 '&PDU'
-                                            ])
+                                            ))
 
     def _get_pdu_path(self, can_frame):
         pdu_ref = self._get_unique_arxml_child(can_frame,
-                                               [
+                                               (
                                                    'PDU-TO-FRAME-MAPPINGS',
                                                    '&PDU-TO-FRAME-MAPPING',
                                                    'PDU-REF'
-                                               ])
+                                               ))
         if pdu_ref is not None:
             pdu_ref = self._get_absolute_arxml_path(pdu_ref,
                                                     pdu_ref.text,
@@ -2325,27 +2578,14 @@ class SystemLoader:
         return pdu_ref
 
     def _get_compu_method(self, system_signal):
-        if self.autosar_version_newer(4):
-            return self._get_unique_arxml_child(system_signal,
-                                                [
-                                               '&PHYSICAL-PROPS',
-                                               'SW-DATA-DEF-PROPS-VARIANTS',
-                                               '&SW-DATA-DEF-PROPS-CONDITIONAL',
-                                               '&COMPU-METHOD'
-                                                ])
-        else:
-            return self._get_unique_arxml_child(system_signal,
-                                                [
-                                                    '&DATA-TYPE',
-                                                    'SW-DATA-DEF-PROPS',
-                                                    '&COMPU-METHOD'
-                                                ])
+        return self._get_unique_arxml_child(system_signal,
+                                            self._compu_method_spec)
 
     def _get_sw_base_type(self, i_signal):
         return self._get_unique_arxml_child(i_signal,
-                                            [
+                                            (
                                                '&NETWORK-REPRESENTATION-PROPS',
                                                'SW-DATA-DEF-PROPS-VARIANTS',
                                                '&SW-DATA-DEF-PROPS-CONDITIONAL',
                                                '&BASE-TYPE'
-                                            ])
+                                            ))
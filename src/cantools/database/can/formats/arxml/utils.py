@@ -1,7 +1,11 @@
 # utility functions that are helpful when dealing with ARXML files
+from functools import lru_cache
 from typing import Union
 
 
+# the same few strings (frame ids, lengths, start bits, ...) are
+# converted over and over again when loading a file
+@lru_cache(maxsize=4096)
 def parse_number_string(in_string : str, allow_float : bool=False) \
     -> Union[int, float]:
     """Convert a string representing numeric value that is specified
@@ -16,6 +20,12 @@ def parse_number_string(in_string : str, allow_float : bool=False) \
       numbers (e.g., they produce "123.0" instead of "123")
     """
 
+    # fast path for the by far most common case: a plain decimal
+    # integer without a leading zero (which would denote octal)
+    if in_string.isdecimal() \
+       and (in_string[0] != '0' or len(in_string) == 1):
+        return int(in_string)
+
     # the string literals "true" and "false" are interpreted as 1 and 0
     if in_string == 'true':
         return 1
@@ -42,4 +52,12 @@ def parse_number_string(in_string : str, allow_float : bool=False) \
         # python's int(*, 0) does not for some reason.
         return int(in_string, 8)
 
-    return int(in_string, 0) # autodetect the base
+    try:
+        return int(in_string, 0) # autodetect the base
+    except ValueError:
+        if not allow_float:
+            raise
+
+        # floating point values may also be specified using the
+        # exponential notation (e.g., "1e-05")
+        return float(in_string)
@@ -1,4 +1,3 @@
-import binascii
 import datetime
 import enum
 import re
@@ -17,6 +16,9 @@ class TimestampFormat(enum.Enum):
 class DataFrame:
     """Container for a parsed log entry (ie. a CAN frame)."""
 
+    # log files may contain millions of frames
+    __slots__ = ('channel', 'frame_id', 'data', 'timestamp', 'timestamp_format')
+
     def __init__(self, channel: str,
                  frame_id: int,
                  data: bytes,
@@ -52,15 +54,13 @@ class CandumpDefaultPattern(BasePattern):
     # vcan0  1F0   [8]  00 00 00 00 00 00 1B C1   '.......Á'
     #(Ignore anything after the end of the data to work with candump's ASCII decoding)
     pattern = re.compile(
-        r'^\s*?(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*).*?$')
+        r'^\s*(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*).*$')
 
     @staticmethod
     def unpack(match_object):
-        channel = match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
+        channel, can_id, can_data = match_object.group('channel', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
         timestamp = None
         timestamp_format = TimestampFormat.MISSING
 
@@ -74,17 +74,15 @@ class CandumpTimestampedPattern(BasePattern):
     # (000.000000)  vcan0  0C8   [8]  31 30 30 2E 35 20 46 4D   '100.5 FM'
     #(Ignore anything after the end of the data to work with candump's ASCII decoding)
     pattern = re.compile(
-        r'^\s*?\((?P<timestamp>[\d.]+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*).*?$')
+        r'^\s*\((?P<timestamp>[\d.]+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*).*$')
 
     @staticmethod
     def unpack(match_object):
-        channel = match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
+        timestamp, channel, can_id, can_data = match_object.group('timestamp', 'channel', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
 
-        seconds = float(match_object.group('timestamp'))
+        seconds = float(timestamp)
         if seconds < 662688000:  # 1991-01-01 00:00:00, "Released in 1991, the Mercedes-Benz W140 was the first production vehicle to feature a CAN-based multiplex wiring system."
             timestamp = datetime.timedelta(seconds=seconds)
             timestamp_format = TimestampFormat.RELATIVE
@@ -99,21 +97,39 @@ class CandumpDefaultLogPattern(BasePattern):
     # (1579857014.345944) can2 486#82967A6B006B07F8
     # (1613656104.501098) can2 14C##16A0FFE00606E022400000000000000A0FFFF00FFFF25000600000000000000FE
     pattern = re.compile(
-        r'^\s*?\((?P<timestamp>[\d.]+?)\)\s+?(?P<channel>[a-zA-Z0-9]+)\s+?(?P<can_id>[0-9A-F]+?)#(#[0-9A-F])?(?P<can_data>([0-9A-Fa-f]{2})*)(\s+[RT])?$')
+        r'^\s*\((?P<timestamp>[\d.]+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)#(#[0-9A-F])?(?P<can_data>([0-9A-Fa-f]{2})*)(\s+[RT])?$')
 
     @staticmethod
     def unpack(match_object):
-        channel = match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        timestamp = datetime.datetime.fromtimestamp(float(match_object.group('timestamp')), datetime.timezone.utc)
+        timestamp, channel, can_id, can_data = match_object.group('timestamp', 'channel', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        timestamp = datetime.datetime.fromtimestamp(float(timestamp), datetime.timezone.utc)
         timestamp_format = TimestampFormat.ABSOLUTE
 
         return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format)
 
 
+def _parse_absolute_timestamp(timestamp):
+    """Parse a timestamp of the form "2020-12-19 12:04:45.485261".
+
+    The pattern guarantees the fixed positions of the fields, so they are
+    sliced out directly, which is much faster than strptime().
+    """
+    fraction = timestamp[20:]
+    if len(fraction) > 6:
+        # not representable; let strptime() raise the error
+        return datetime.datetime.strptime(timestamp, "%Y-%m-%d %H:%M:%S.%f")
+
+    return datetime.datetime(int(timestamp[0:4]),
+                             int(timestamp[5:7]),
+                             int(timestamp[8:10]),
+                             int(timestamp[11:13]),
+                             int(timestamp[14:16]),
+                             int(timestamp[17:19]),
+                             int(fraction.ljust(6, '0')))
+
+
 class CandumpAbsoluteLogPattern(BasePattern):
     #candump vcan0 -tA
     # (2020-12-19 12:04:45.485261)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
@@ -121,16 +137,14 @@ class CandumpAbsoluteLogPattern(BasePattern):
     # (2020-12-19 12:04:45.485261)  vcan0  0C8   [8]  31 30 30 2E 35 20 46 4D   '100.5 FM'
     #(Ignore anything after the end of the data to work with candump's ASCII decoding)
     pattern = re.compile(
-        r'^\s*?\((?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*).*?$')
+        r'^\s*\((?P<timestamp>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+)\)\s+(?P<channel>[a-zA-Z0-9]+)\s+(?P<can_id>[0-9A-F]+)\s+\[\d+\]\s*(?P<can_data>[0-9A-F ]*).*$')
 
     @staticmethod
     def unpack(match_object):
-        channel = match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
+        timestamp, channel, can_id, can_data = match_object.group('timestamp', 'channel', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        timestamp = _parse_absolute_timestamp(timestamp)
         timestamp_format = TimestampFormat.ABSOLUTE
 
         return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format)
@@ -142,7 +156,7 @@ class PCANTracePatternV10(BasePattern):
     1) 1841 0001 8 00 00 00 00 00 00 00 00
     """
     pattern = re.compile(
-        r'^\s*?\d+\)\s*?(?P<timestamp>\d+)\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
+        r'^\s*\d+\)\s*(?P<timestamp>\d+)\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
 
     @staticmethod
     def unpack(match_object):
@@ -151,11 +165,10 @@ class PCANTracePatternV10(BasePattern):
         <logreader.DataFrame object at ...>
         """
         channel = 'pcanx'
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        millis = float(match_object.group('timestamp'))
+        timestamp, can_id, can_data = match_object.group('timestamp', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        millis = float(timestamp)
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
@@ -169,7 +182,7 @@ class PCANTracePatternV11(BasePattern):
     1)      6357.2 Rx        0401  8    00 00 00 00 00 00 00 00
     """
     pattern = re.compile(
-        r'^\s*?\d+\)\s*?(?P<timestamp>\d+.\d+)\s+.+\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
+        r'^\s*\d+\)\s*(?P<timestamp>\d+.\d+)\s+.+\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
 
     @staticmethod
     def unpack(match_object):
@@ -178,11 +191,10 @@ class PCANTracePatternV11(BasePattern):
         <logreader.DataFrame object at ...>
         """
         channel = 'pcanx'
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        millis = float(match_object.group('timestamp'))
+        timestamp, can_id, can_data = match_object.group('timestamp', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        millis = float(timestamp)
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
@@ -196,7 +208,7 @@ class PCANTracePatternV12(BasePattern):
     1)      6357.213 1  Rx        0401  8    00 00 00 00 00 00 00 00
     """
     pattern = re.compile(
-        r'^\s*?\d+\)\s*?(?P<timestamp>\d+.\d+)\s+(?P<channel>[0-9])\s+.+\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
+        r'^\s*\d+\)\s*(?P<timestamp>\d+.\d+)\s+(?P<channel>[0-9])\s+.+\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
 
     @staticmethod
     def unpack(match_object):
@@ -204,12 +216,11 @@ class PCANTracePatternV12(BasePattern):
         >>> PCANTracePatternV12().match("  1)      6357.213 1  Rx        0401  8    00 00 00 00 00 00 00 00") #doctest: +ELLIPSIS
         <logreader.DataFrame object at ...>
         """
-        channel = 'pcan' + match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        millis = float(match_object.group('timestamp'))
+        timestamp, channel, can_id, can_data = match_object.group('timestamp', 'channel', 'can_id', 'can_data')
+        channel = 'pcan' + channel
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        millis = float(timestamp)
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
@@ -223,7 +234,7 @@ class PCANTracePatternV13(BasePattern):
     1)      6357.213 1  Rx        0401 -  8    00 00 00 00 00 00 00 00
     """
     pattern = re.compile(
-        r'^\s*?\d+\)\s*?(?P<timestamp>\d+.\d+)\s+(?P<channel>[0-9])\s+.+\s+(?P<can_id>[0-9A-F]+)\s+-\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
+        r'^\s*\d+\)\s*(?P<timestamp>\d+.\d+)\s+(?P<channel>[0-9])\s+.+\s+(?P<can_id>[0-9A-F]+)\s+-\s+(?P<dlc>[0-9])\s+(?P<can_data>[0-9A-F ]*)$')
 
     @staticmethod
     def unpack(match_object):
@@ -231,12 +242,11 @@ class PCANTracePatternV13(BasePattern):
         >>> PCANTracePatternV13().match("  1)      6357.213 1  Rx        0401 -  8    00 00 00 00 00 00 00 00") #doctest: +ELLIPSIS
         <logreader.DataFrame object at ...>
         """
-        channel = 'pcan' + match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        millis = float(match_object.group('timestamp'))
+        timestamp, channel, can_id, can_data = match_object.group('timestamp', 'channel', 'can_id', 'can_data')
+        channel = 'pcan' + channel
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        millis = float(timestamp)
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
@@ -258,11 +268,10 @@ class PCANTracePatternV20(BasePattern):
         <logreader.DataFrame object at ...>
         """
         channel = 'pcanx'
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        millis = float(match_object.group('timestamp'))
+        timestamp, can_id, can_data = match_object.group('timestamp', 'can_id', 'can_data')
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        millis = float(timestamp)
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
@@ -284,12 +293,11 @@ class PCANTracePatternV21(BasePattern):
         >>> PCANTracePatternV21().match(" 1      1059.900 DT 1 0300 Rx - 7 00 00 00 00 04 00 00") #doctest: +ELLIPSIS
         <logreader.DataFrame object at ...>
         """
-        channel = 'pcan' + match_object.group('channel')
-        frame_id = int(match_object.group('can_id'), 16)
-        data = match_object.group('can_data')
-        data = data.replace(' ', '')
-        data = binascii.unhexlify(data)
-        millis = float(match_object.group('timestamp'))
+        timestamp, channel, can_id, can_data = match_object.group('timestamp', 'channel', 'can_id', 'can_data')
+        channel = 'pcan' + channel
+        frame_id = int(can_id, 16)
+        data = bytes.fromhex(can_data)
+        millis = float(timestamp)
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
@@ -297,6 +305,41 @@ class PCANTracePatternV21(BasePattern):
         return DataFrame(channel=channel, frame_id=frame_id, data=data, timestamp=timestamp, timestamp_format=timestamp_format)
 
 
+# the patterns in the order in which they are tried by the parser
+_DETECTABLE_PATTERNS = [
+    CandumpDefaultPattern,
+    CandumpTimestampedPattern,
+    CandumpDefaultLogPattern,
+    CandumpAbsoluteLogPattern,
+    PCANTracePatternV21,
+    PCANTracePatternV20,
+    PCANTracePatternV13,
+    PCANTracePatternV12,
+    PCANTracePatternV11,
+    PCANTracePatternV10,
+]
+
+
+def _make_detection_pattern(patterns):
+    """Combine the regular expressions of the given patterns into a single
+    one. Each pattern becomes an alternative in a group named after its
+    class, and the groups of the individual patterns are stripped of their
+    (clashing) names. Since alternatives are tried from left to right, the
+    first pattern which matches a line wins.
+    """
+    alternatives = []
+
+    for pattern in patterns:
+        unnamed = re.sub(r'\(\?P<\w+>', '(', pattern.pattern.pattern)
+        alternatives.append(f'(?P<{pattern.__name__}>{unnamed})')
+
+    return re.compile('|'.join(alternatives))
+
+
+_DETECTION_PATTERN = _make_detection_pattern(_DETECTABLE_PATTERNS)
+_PATTERNS_BY_NAME = {pattern.__name__: pattern for pattern in _DETECTABLE_PATTERNS}
+
+
 class Parser:
     """A CAN log file parser.
 
@@ -314,16 +357,18 @@ class Parser:
 
     @staticmethod
     def detect_pattern(line):
-        for p in [CandumpDefaultPattern, CandumpTimestampedPattern, CandumpDefaultLogPattern, CandumpAbsoluteLogPattern, PCANTracePatternV21, PCANTracePatternV20, PCANTracePatternV13, PCANTracePatternV12, PCANTracePatternV11, PCANTracePatternV10]:
-            mo = p.pattern.match(line)
-            if mo:
-                return p
+        mo = _DETECTION_PATTERN.match(line)
+        if mo:
+            return _PATTERNS_BY_NAME[mo.lastgroup]
 
     def parse(self, line):
         if self.pattern is None:
             self.pattern = self.detect_pattern(line)
-        if self.pattern is None:
-            return None
+            if self.pattern is None:
+                return None
+            # the format of the log does not change, so all further
+            # lines are directly handed to the detected pattern
+            self.parse = self.pattern.match
         return self.pattern.match(line)
 
     def iterlines(self, keep_unknowns=False):
@@ -334,10 +379,10 @@ class Parser:
         """
         if self.stream is None:
             return
-        while True:
-            nl = self.stream.readline()
-            if nl == '':
-                return
+        # iterating over the stream reads it in chunks, but still
+        # yields each line as soon as it is available, e.g., when live
+        # decoding the output of candump
+        for nl in self.stream:
             nl = nl.strip('\r\n')
             frame = self.parse(nl)
             if frame:
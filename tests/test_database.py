@@ -4397,6 +4397,26 @@ class CanToolsDatabaseTest(unittest.TestCase):
         self.assertEqual(loader.autosar_version_newer(4, 2), False)
         self.assertEqual(loader.autosar_version_newer(4, 3), False)
 
+    def test_arxml_parse_number_string(self):
+        parse_number_string = \
+            cantools.database.can.formats.arxml.utils.parse_number_string
+
+        self.assertEqual(parse_number_string('123'), 123)
+        self.assertEqual(parse_number_string('0'), 0)
+        self.assertEqual(parse_number_string('017'), 15)
+        self.assertEqual(parse_number_string('0x1E'), 30)
+        self.assertEqual(parse_number_string('true'), 1)
+        self.assertEqual(parse_number_string('12.0'), 12)
+        self.assertEqual(parse_number_string('0.25', True), 0.25)
+        self.assertEqual(parse_number_string('1e-05', True), 1e-05)
+        self.assertEqual(parse_number_string('-2.5E3', True), -2500.0)
+
+        with self.assertRaises(ValueError):
+            parse_number_string('0.25')
+
+        with self.assertRaises(ValueError):
+            parse_number_string('1e-05')
+
     def test_DAI_namespace(self):
         cantools.db.load_file('tests/files/arxml/system-DAI-3.1.2.arxml')
 
@@ -5231,7 +5251,7 @@ class CanToolsDatabaseTest(unittest.TestCase):
         # test multiple child node matches
         children1 = loader._get_arxml_children(loader._root, ["AR-PACKAGES", "*AR-PACKAGE"])
         childen1_short_names = \
-            [x.find("ns:SHORT-NAME", loader._xml_namespaces).text for x in children1]
+            [x.find(f"{{{loader.xml_namespace}}}SHORT-NAME").text for x in children1]
 
         self.assertEqual(childen1_short_names,
                          [
@@ -5358,6 +5378,126 @@ class CanToolsDatabaseTest(unittest.TestCase):
         encoded = message4.encode(input_dict, padding=True)
         self.assertEqual(encoded, encoded_ref)
 
+    def test_system_arxml_relative_pdu_ref(self):
+        # let the PDU-REF of Message1 rely on a default reference base
+        with open('tests/files/arxml/system-4.2.arxml') as fin:
+            arxml_str = fin.read()
+
+        arxml_str = arxml_str.replace(
+            """      <SHORT-NAME>CanFrame</SHORT-NAME>
+      <ELEMENTS>""",
+            """      <SHORT-NAME>CanFrame</SHORT-NAME>
+      <REFERENCE-BASES>
+        <REFERENCE-BASE>
+          <SHORT-LABEL>PduBase</SHORT-LABEL>
+          <IS-DEFAULT>true</IS-DEFAULT>
+          <IS-GLOBAL>false</IS-GLOBAL>
+          <BASE-IS-THIS-PACKAGE>false</BASE-IS-THIS-PACKAGE>
+          <PACKAGE-REF DEST="AR-PACKAGE">/ISignalIPdu</PACKAGE-REF>
+        </REFERENCE-BASE>
+      </REFERENCE-BASES>
+      <ELEMENTS>""")
+        arxml_str = arxml_str.replace(
+            '<PDU-REF DEST="I-SIGNAL-I-PDU">/ISignalIPdu/message1</PDU-REF>',
+            '<PDU-REF DEST="I-SIGNAL-I-PDU">message1</PDU-REF>')
+
+        db = cantools.db.load_string(arxml_str, 'arxml')
+
+        message_1 = db.get_message_by_name('Message1')
+        self.assertEqual(message_1.autosar.pdu_paths,
+                         [ '/ISignalIPdu/message1' ])
+        ref_db = cantools.db.load_file('tests/files/arxml/system-4.2.arxml')
+        ref_message_1 = ref_db.get_message_by_name('Message1')
+        self.assertEqual([ x.name for x in message_1.signals ],
+                         [ x.name for x in ref_message_1.signals ])
+
+    def test_system_arxml_float_signal_limits(self):
+        # give the floating point signal5 a linear computation method
+        # whose limits are not integers
+        with open('tests/files/arxml/system-4.2.arxml') as fin:
+            arxml_str = fin.read()
+
+        arxml_str = arxml_str.replace(
+            """        <!-- /CompuMethod/Signal4 -->""",
+            """        <COMPU-METHOD>
+          <SHORT-NAME>Signal5</SHORT-NAME>
+          <CATEGORY>LINEAR</CATEGORY>
+          <COMPU-INTERNAL-TO-PHYS>
+            <COMPU-SCALES>
+              <COMPU-SCALE>
+                <LOWER-LIMIT>-1.5</LOWER-LIMIT>
+                <UPPER-LIMIT>2.5e1</UPPER-LIMIT>
+                <COMPU-RATIONAL-COEFFS>
+                  <COMPU-NUMERATOR>
+                    <V>1</V>
+                    <V>0.5</V>
+                  </COMPU-NUMERATOR>
+                  <COMPU-DENOMINATOR>
+                    <V>1</V>
+                  </COMPU-DENOMINATOR>
+                </COMPU-RATIONAL-COEFFS>
+              </COMPU-SCALE>
+            </COMPU-SCALES>
+          </COMPU-INTERNAL-TO-PHYS>
+        </COMPU-METHOD>
+        <!-- /CompuMethod/Signal4 -->""")
+        arxml_str = arxml_str.replace(
+            """        <!-- /SystemSignal/Signal4 -->""",
+            """        <SYSTEM-SIGNAL>
+          <SHORT-NAME>Signal5</SHORT-NAME>
+          <PHYSICAL-PROPS>
+            <SW-DATA-DEF-PROPS-VARIANTS>
+              <SW-DATA-DEF-PROPS-CONDITIONAL>
+                <COMPU-METHOD-REF DEST="COMPU-METHOD">/CompuMethod/Signal5</COMPU-METHOD-REF>
+              </SW-DATA-DEF-PROPS-CONDITIONAL>
+            </SW-DATA-DEF-PROPS-VARIANTS>
+          </PHYSICAL-PROPS>
+        </SYSTEM-SIGNAL>
+        <!-- /SystemSignal/Signal4 -->""")
+        arxml_str = arxml_str.replace(
+            """                <BASE-TYPE-REF DEST="SW-BASE-TYPE">/SwBaseType/float</BASE-TYPE-REF>
+              </SW-DATA-DEF-PROPS-CONDITIONAL>
+            </SW-DATA-DEF-PROPS-VARIANTS>
+          </NETWORK-REPRESENTATION-PROPS>""",
+            """                <BASE-TYPE-REF DEST="SW-BASE-TYPE">/SwBaseType/float</BASE-TYPE-REF>
+              </SW-DATA-DEF-PROPS-CONDITIONAL>
+            </SW-DATA-DEF-PROPS-VARIANTS>
+          </NETWORK-REPRESENTATION-PROPS>
+          <SYSTEM-SIGNAL-REF DEST="SYSTEM-SIGNAL">/SystemSignal/Signal5</SYSTEM-SIGNAL-REF>""")
+
+        db = cantools.db.load_string(arxml_str, 'arxml')
+
+        signal_5 = db.get_message_by_name('Message1').get_signal_by_name('signal5')
+        self.assertTrue(signal_5.is_float)
+        self.assertEqual(signal_5.scale, 0.5)
+        self.assertEqual(signal_5.offset, 1)
+        self.assertEqual(signal_5.minimum, 0.25)
+        self.assertEqual(signal_5.maximum, 13.5)
+
+    def test_system_arxml_shared_system_signal(self):
+        # let signal1 and signal6 refer to the same system signal
+        with open('tests/files/arxml/system-4.2.arxml') as fin:
+            arxml_str = fin.read()
+
+        arxml_str = arxml_str.replace(
+            '<SYSTEM-SIGNAL-REF DEST="SYSTEM-SIGNAL">/SystemSignal/Signal1</SYSTEM-SIGNAL-REF>',
+            '<SYSTEM-SIGNAL-REF DEST="SYSTEM-SIGNAL">/SystemSignal/Signal6</SYSTEM-SIGNAL-REF>')
+
+        db = cantools.db.load_string(arxml_str, 'arxml')
+
+        message_1 = db.get_message_by_name('Message1')
+        signal_1 = message_1.get_signal_by_name('signal1')
+        signal_6 = message_1.get_signal_by_name('signal6')
+        self.assertEqual(signal_1.choices, {0: 'zero'})
+        self.assertEqual(signal_6.choices, {0: 'zero'})
+
+        # the named values of the signals must be independent
+        signal_1.choices[0].name = 'null'
+        signal_1.choices[0].comments['EN'] = 'Naught'
+        self.assertEqual(signal_6.choices, {0: 'zero'})
+        self.assertEqual(signal_6.choices[0].comments,
+                         {'DE': 'Nichts', 'EN': 'Nothing'})
+
     def test_system_arxml_float_values(self):
         db = cantools.db.load_file('tests/files/arxml/system-float-values.arxml')
 